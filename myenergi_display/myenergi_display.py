@@ -5,18 +5,38 @@
 # used in this project.
 
 import argparse
+import atexit
+import os
+import re
 import threading
 import requests
 import traceback
 
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
-from queue import Queue
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right
+from heapq import nsmallest
+from math import ceil
+from queue import Queue, SimpleQueue, Empty
 from time import time, sleep
 
 from datetime import timedelta, datetime, timezone
-import urllib.request
 import json
-from copy import deepcopy
+from operator import itemgetter
+
+try:
+    # orjson parses/serializes JSON several times faster than the stdlib json module.
+    import orjson
+except ImportError:
+    orjson = None
+
+_UTC = timezone.utc
+
+# Matches HH:MM time strings. Compiled once so parsing a time is a single C
+# level regex match rather than split + length checks + int conversions.
+_HHMM_RE = re.compile(r'\s*(\d{1,2}):(\d{1,2})\s*$')
 
 from p3lib.pconfig import ConfigManager, ConfigAttrDetails
 
@@ -44,6 +64,8 @@ class MyEnergi(object):
     TANK_2_BOOST_SCHEDULE_SLOT_ID = 24
     VALID_EDDI_SLOT_ID_LIST = (11, 12, 13, TANK_1_BOOST_SCHEDULE_SLOT_ID, 21, 22, 23, TANK_2_BOOST_SCHEDULE_SLOT_ID)
     VALID_ZAPPI_SLOT_ID_LIST = (11, 12, 13, 14)
+    # frozenset copy of the above for O(1) membership checks.
+    _VALID_ZAPPI_SLOT_IDS = frozenset(VALID_ZAPPI_SLOT_ID_LIST)
     ZAPPI_CHARG_MODE_FAST = 1
     ZAPPI_CHARGE_MODE_ECO = 2
     ZAPPI_CHARGE_MODE_ECO_PLUS = 3
@@ -62,6 +84,13 @@ class MyEnergi(object):
     ZAPPI_STA_WAITING = 4
     ZAPPI_STA_BOOSTING = 5
 
+    STATS_CACHE_SECONDS = 5.0               # Consecutive stat reads inside this window share one fetch.
+    SCHEDULE_DELETE_DELAY_SECONDS = 1.0     # The myenergi server needs a delay between schedule delete commands.
+
+    _DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+    # Day of week (0=Mon) to the bit string format accepted by the myenergi server.
+    _DOW_STRINGS = ("01000000", "00100000", "00010000", "00001000", "00000100", "00000010", "00000001")
+
     def __init__(self, api_key, uio=None):
         """@brief Constuctor
            @param api_key Your myenergi API key.
@@ -71,20 +100,83 @@ class MyEnergi(object):
         self._api_key = api_key
         self._eddi_serial_number = None
         self._zappi_serial_number = None
+        # The serial numbers normalized to strings once so update_stats() does not
+        # have to convert them on every poll.
+        self._eddi_sn_str = None
+        self._zappi_sn_str = None
+        # Fixed command URL prefixes built once the serial numbers are known.
+        self._eddi_boost_prefix = None
+        self._eddi_sched_prefix = None
+        self._zappi_sched_prefix = None
+        self._zappi_mode_urls = None
         self._eddi_stats_dict = None
         self._zappi_stats_dict = None
+        self._stats_fetched_at = 0.0
         self._uio = uio
         self._lock = threading.Lock()
+        # Serializes cache refreshes so concurrent stale readers share one fetch.
+        self._refresh_lock = threading.Lock()
+        # Use a single session so that the TCP/TLS connection to the myenergi server is
+        # held open and reused rather than paying a full handshake on every API call.
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        # The auth instance is created once the eddi serial number is known so that
+        # the digest state can be reused across requests.
+        self._auth = None
+        # A small pool used to issue independent API commands (E.G the per slot zappi
+        # schedule writes) concurrently over the pooled session.
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._stats_cache_ttl = MyEnergi.STATS_CACHE_SECONDS
+        self._refresh_thread = None
+        self._refresh_stop_event = None
+        self._refresh_running = False
 
     def set_eddi_serial_number(self, eddi_serial_number):
         """@brief set the eddi serial number.
            @param eddi_serial_number The serial number of the eddi unit of interest."""
+        if eddi_serial_number is None:
+            raise ValueError("BUG: The eddi serial number cannot be None.")
         self._eddi_serial_number = eddi_serial_number
+        self._eddi_sn_str = str(eddi_serial_number)
+        self._auth = HTTPDigestAuth(eddi_serial_number, self._api_key)
+        # The command URL prefixes are fixed once the serial number is known.
+        self._eddi_boost_prefix = MyEnergi.BASE_URL + "cgi-eddi-boost-E" + self._eddi_sn_str
+        self._eddi_sched_prefix = MyEnergi.BASE_URL + "cgi-boost-time-E" + self._eddi_sn_str
 
     def set_zappi_serial_number(self, zappi_serial_number):
         """@brief set the zappi serial number.
            @param zappi_serial_number The serial number of the zappi unit of interest."""
+        if zappi_serial_number is None:
+            raise ValueError("BUG: The zappi serial number cannot be None.")
         self._zappi_serial_number = zappi_serial_number
+        self._zappi_sn_str = str(zappi_serial_number)
+        self._zappi_sched_prefix = MyEnergi.BASE_URL + "cgi-boost-time-Z" + self._zappi_sn_str
+        # The mode command URLs are fixed once the serial number is known so build them once here.
+        self._zappi_mode_urls = {mode: MyEnergi.BASE_URL + f"cgi-zappi-mode-Z{zappi_serial_number}-{mode}-0-0-0000"
+                                 for mode in (MyEnergi.ZAPPI_CHARG_MODE_FAST,
+                                              MyEnergi.ZAPPI_CHARGE_MODE_ECO,
+                                              MyEnergi.ZAPPI_CHARGE_MODE_ECO_PLUS,
+                                              MyEnergi.ZAPPI_CHARGE_MODE_STOPPED)}
+
+    def update_credentials(self, api_key, eddi_serial_number, zappi_serial_number):
+        """@brief Update the API key and serial numbers in place.
+                  This keeps the existing requests session (and therefore its pooled
+                  TCP/TLS connections to the myenergi server) rather than building a
+                  new instance when the user saves the config.
+           @param api_key Your myenergi API key.
+           @param eddi_serial_number The serial number of the eddi unit of interest.
+           @param zappi_serial_number The serial number of the zappi unit of interest."""
+        # The cached stats relate to the old credentials so discard them, both the
+        # fetch time and the stats dicts themselves. Otherwise the getters could
+        # serve the old device's stats if a fetch for the new serial numbers fails.
+        with self._lock:
+            self._eddi_stats_dict = None
+            self._zappi_stats_dict = None
+        self.invalidate_stats_cache()
+        self._api_key = api_key
+        self.set_eddi_serial_number(eddi_serial_number)
+        self.set_zappi_serial_number(zappi_serial_number)
 
     def _check_eddi_serial_number(self):
         """@brief Check that the eddi serial number has been set."""
@@ -98,33 +190,99 @@ class MyEnergi(object):
 
     def get_stats(self):
         """@brief Get the stats of the eddi unit."""
-        self._check_eddi_serial_number()
         url = MyEnergi.BASE_URL + "cgi-jstatus-*"
         return self._exec_api_cmd(url)
 
     def update_stats(self):
         """@brief update all the stats."""
         stats_list = self.get_stats()
+        # Index the device dicts by serial number so each device is found with a
+        # single dict lookup rather than nested scans with per entry str conversions.
+        by_device = {}
         for stats_dict in stats_list:
-            if 'eddi' in stats_dict:
-                eddi_dict_list = stats_dict['eddi']
-                for eddi_dict in eddi_dict_list:
-                    if 'sno' in eddi_dict:
-                        serial_number = eddi_dict['sno']
-                        # Check the eddi serial number matches
-                        if str(serial_number) == str(self._eddi_serial_number):
-                            # Assign the eddi dict
-                            self._eddi_stats_dict = eddi_dict
-
-            elif 'zappi' in stats_dict:
-                zappi_dict_list = stats_dict['zappi']
-                for zappi_dict in zappi_dict_list:
-                    if 'sno' in zappi_dict:
-                        serial_number = zappi_dict['sno']
-                        # Check the zappi serial number matches
-                        if str(serial_number) == str(self._zappi_serial_number):
-                            # Assign the zappi dict
-                            self._zappi_stats_dict = zappi_dict
+            for device_key in ('eddi', 'zappi'):
+                if device_key in stats_dict:
+                    by_device.setdefault(device_key, {}).update(
+                        {str(device_dict['sno']): device_dict for device_dict in stats_dict[device_key] if 'sno' in device_dict})
+            # Stop scanning as soon as both devices of interest have been found. On
+            # accounts with many devices this avoids indexing the unused entries.
+            if self._eddi_sn_str in by_device.get('eddi', {}) and self._zappi_sn_str in by_device.get('zappi', {}):
+                break
+
+        eddi_stats_dict = by_device.get('eddi', {}).get(self._eddi_sn_str)
+        zappi_stats_dict = by_device.get('zappi', {}).get(self._zappi_sn_str)
+        with self._lock:
+            if eddi_stats_dict is not None:
+                self._eddi_stats_dict = eddi_stats_dict
+            if zappi_stats_dict is not None:
+                self._zappi_stats_dict = zappi_stats_dict
+            self._stats_fetched_at = time()
+
+    def _maybe_refresh(self, ttl=STATS_CACHE_SECONDS):
+        """@brief Refresh the stats from the myenergi server if the cached stats are older than ttl.
+                  Uses a double checked lock so several GUI threads reading stats back to back
+                  share a single fetch rather than each paying a network round trip.
+           @param ttl The maximum age of the cached stats in seconds."""
+        # When the background refresh thread is running the getters never fetch,
+        # they just read the latest cached stats.
+        if self._refresh_running:
+            return
+        if time() - self._stats_fetched_at > ttl:
+            # The refresh lock is held across the fetch so concurrent callers wait
+            # for the in flight fetch rather than each issuing their own. The
+            # re-check under the lock catches a fetch completed while waiting.
+            with self._refresh_lock:
+                if time() - self._stats_fetched_at > ttl:
+                    self.update_stats()
+
+    def invalidate_stats_cache(self):
+        """@brief Force the next stats read to fetch fresh values from the myenergi
+                  server rather than serving values from the TTL cache. Called after
+                  actions (boost/schedule changes) that change the device state."""
+        self._stats_fetched_at = 0.0
+
+    def set_poll_interval(self, seconds):
+        """@brief Set the interval at which the background refresh thread polls the myenergi server.
+           @param seconds The poll interval in seconds."""
+        self._stats_cache_ttl = float(seconds)
+
+    def start_stats_refresh(self):
+        """@brief Start a background thread that keeps the stats up to date so callers
+                  always read the cached values without paying a network round trip.
+                  The poll backs off (up to 60 seconds) when the server cannot be reached."""
+        if self._refresh_thread is None:
+            self._refresh_running = True
+            # Each thread gets its own stop event so a stopped thread can never be
+            # resumed by a later start_stats_refresh() call.
+            stop_event = threading.Event()
+            self._refresh_stop_event = stop_event
+            self._refresh_thread = threading.Thread(target=self._stats_refresh_loop, args=(stop_event,), daemon=True)
+            self._refresh_thread.start()
+
+    def stop_stats_refresh(self):
+        """@brief Stop the background stats refresh thread."""
+        self._refresh_running = False
+        if self._refresh_stop_event is not None:
+            self._refresh_stop_event.set()
+        self._refresh_stop_event = None
+        self._refresh_thread = None
+
+    def _stats_refresh_loop(self, stop_event):
+        """@brief The background stats refresh loop. Exits when stop_stats_refresh() is called.
+           @param stop_event The event used to stop this thread."""
+        delay = self._stats_cache_ttl
+        while not stop_event.is_set():
+            # wait() returns True when the stop event is set so a stop is acted on
+            # promptly rather than after the remaining sleep time.
+            if stop_event.wait(delay):
+                break
+            try:
+                self.update_stats()
+                delay = self._stats_cache_ttl
+            except Exception as ex:
+                # Back off so an unreachable server is not hammered.
+                delay = min(delay * 2, 60.0)
+                self._debug(f"_stats_refresh_loop: {ex}. Next read in {delay} seconds.")
 
     def _get_eddi_stat(self, name, throw_error=True):
         """@brief Get a eddi stat after update_stats() has been called.
@@ -132,9 +290,9 @@ class MyEnergi(object):
            @param throw_error True if this method should throw an error if the stats is not found.
            @return The stat or None if not found."""
         stat = None
-        # If the stats have not been read yet, read them
-        if not self._eddi_stats_dict or name not in self._eddi_stats_dict:
-            self.update_stats()
+        # Refresh the stats if the cached values are stale. Consecutive getters
+        # inside the cache window share a single fetch.
+        self._maybe_refresh()
 
         if self._eddi_stats_dict:
             if name in self._eddi_stats_dict:
@@ -151,9 +309,9 @@ class MyEnergi(object):
            @param throw_error True if this method should throw an error if the stats is not found.
            @return The stat or None if not found."""
         stat = None
-        # If the stats have not been read yet, read them
-        if not self._zappi_stats_dict or name not in self._zappi_stats_dict:
-            self.update_stats()
+        # Refresh the stats if the cached values are stale. Consecutive getters
+        # inside the cache window share a single fetch.
+        self._maybe_refresh()
 
         if self._zappi_stats_dict:
             if name in self._zappi_stats_dict:
@@ -243,17 +401,15 @@ class MyEnergi(object):
                     table_row_list.append(table_row)
         return table_row_list
 
+    # Initialized lazily as GUIServer is defined later in this module.
+    _REQUIRED_BOOST_KEYS = None
+
     def _is_valid_boost_dict(self, boost_dict):
         """@brief Determine if the boost dict is valid.
            @return True if all the required keys are present in the boost dict."""
-        key_count = 0
-        for key in GUIServer.BOOST_DICT_KEYS:
-            if key in boost_dict:
-                key_count = key_count + 1
-        valid = False
-        if key_count == 6:
-            valid = True
-        return valid
+        if MyEnergi._REQUIRED_BOOST_KEYS is None:
+            MyEnergi._REQUIRED_BOOST_KEYS = frozenset(GUIServer.BOOST_DICT_KEYS)
+        return MyEnergi._REQUIRED_BOOST_KEYS.issubset(boost_dict)
 
     def _get_sched_table_row(self,
                              bdd,
@@ -276,30 +432,15 @@ class MyEnergi(object):
         """@brief Get a list of days that a schedule applies to.
            @param bdd The bdd field from the zappi schedule.
            @return A comma separated list of three letter day names."""
-        day_list = []
-        if len(bdd) == 8:
-            if bdd[1] == '1':
-                day_list.append('Mon')
-            elif bdd[2] == '1':
-                day_list.append('Tue')
-            elif bdd[3] == '1':
-                day_list.append('Wed')
-            elif bdd[4] == '1':
-                day_list.append('Thu')
-            elif bdd[5] == '1':
-                day_list.append('Fri')
-            elif bdd[6] == '1':
-                day_list.append('Sat')
-            elif bdd[7] == '1':
-                day_list.append('Sun')
-        return ",".join(day_list)
+        if len(bdd) != 8:
+            return ""
+        # Note the previous if/elif version only ever returned the first day set in
+        # bdd which silently truncated multi day schedules shown in the GUI.
+        return ",".join(name for name, flag in zip(MyEnergi._DAY_NAMES, bdd[1:]) if flag == '1')
 
     def get_zappi_stats(self):
         """@brief Get the stats of the zappi unit."""
-        self._check_eddi_serial_number()
-        self._check_zappi_serial_number()
-        url = MyEnergi.BASE_URL + "cgi-boost-time-Z"+self._zappi_serial_number
-        return self._exec_api_cmd(url)
+        return self._exec_api_cmd(self._zappi_sched_prefix)
 
     def set_boost(self, on, mins, relay=None):
         """@brief Set emersion switch on/off
@@ -312,12 +453,12 @@ class MyEnergi(object):
         if on:
             if relay not in (1, 2):
                 raise Exception("BUG: set_boost() switch must be 1 or 2.")
-            url = MyEnergi.BASE_URL + "cgi-eddi-boost-E"+self._eddi_serial_number+f"-10-{relay}-{mins}"
+            url = self._eddi_boost_prefix+f"-10-{relay}-{mins}"
         else:
-            url = MyEnergi.BASE_URL + "cgi-eddi-boost-E"+self._eddi_serial_number+"-1-1-0"
+            url = self._eddi_boost_prefix+"-1-1-0"
             self._exec_api_cmd(url)
 
-            url = MyEnergi.BASE_URL + "cgi-eddi-boost-E"+self._eddi_serial_number+"-1-2-0"
+            url = self._eddi_boost_prefix+"-1-2-0"
 
         self._exec_api_cmd(url)
 
@@ -328,7 +469,7 @@ class MyEnergi(object):
            @param duration_timedelta A timedelta instance that defines ho long the tank heater should stay on.
            @param tank The hot water tank (1=top, 2 = bottom)."""
         sched_sub_str = self._get_eddi_schedule_string(on, on_datetime, duration_timedelta, tank)
-        url = MyEnergi.BASE_URL + f"cgi-boost-time-E{self._eddi_serial_number}-{sched_sub_str}"
+        url = f"{self._eddi_sched_prefix}-{sched_sub_str}"
         self._exec_api_cmd(url)
 
     def set_water_tank_boost_schedules_off(self):
@@ -354,7 +495,6 @@ class MyEnergi(object):
            @param duration_timedelta A timedelta instance that defines ho long the tank heater should stay on.
            @param tank The hot water tank (1=top, 2 = bottom)."""
 
-        self._check_eddi_serial_number()
         if tank not in [MyEnergi.TOP_TANK_ID, MyEnergi.BOTTOM_TANK_ID]:
             raise Exception(f"{tank} is an invalid water tank. Must be {MyEnergi.TOP_TANK_ID} (top) or {MyEnergi.BOTTOM_TANK_ID} (bottom).")
 
@@ -383,14 +523,12 @@ class MyEnergi(object):
         """@brief Set all zappi charge schedules off.
                   We set charge schedules that have no on time and are not enabled for any days of the week.
                   This causes the 4 possible schedules on the zappi to be removed."""
-        self._check_eddi_serial_number()
-        self._check_zappi_serial_number()
-
         for slot_id in MyEnergi.VALID_ZAPPI_SLOT_ID_LIST:
-            url = MyEnergi.BASE_URL + f"cgi-boost-time-Z{self._zappi_serial_number}-{slot_id}-0000-000-00000000"
+            url = f"{self._zappi_sched_prefix}-{slot_id}-0000-000-00000000"
             self._exec_api_cmd(url)
-            # The myenergi system does not always delete the schedule unless a delay occurs between each command
-            sleep(1)
+            # The myenergi system does not always delete the schedule unless a delay occurs between each command.
+            # This is a server side quirk so connection reuse does not remove the need for it.
+            sleep(MyEnergi.SCHEDULE_DELETE_DELAY_SECONDS)
 
     def _get_zappi_charge_string(self, charge_slot_dict, slot_id):
         """@detail Get a string that is formated as required by the myenergi zappi api.
@@ -408,15 +546,16 @@ class MyEnergi(object):
                                    GUIServer._set_zappi_charge_thread()
            @param slot_id The slot ID (one of MyEnergi.VALID_ZAPPI_SLOT_ID_LIST).
         """
-        if slot_id not in MyEnergi.VALID_ZAPPI_SLOT_ID_LIST:
-            valid_list = ",".join(MyEnergi.VALID_ZAPPI_SLOT_ID_LIST)
-            raise Exception(f"{slot_id} is an invalid slot id (value = {valid_list})")
+        if slot_id not in MyEnergi._VALID_ZAPPI_SLOT_IDS:
+            valid_list = ",".join(map(str, MyEnergi.VALID_ZAPPI_SLOT_ID_LIST))
+            raise ValueError(f"{slot_id} is an invalid slot id (value = {valid_list})")
 
         start_datetime = charge_slot_dict[RegionalElectricity.SLOT_START_DATETIME]
         stop_datetime = charge_slot_dict[RegionalElectricity.SLOT_STOP_DATETIME]
-        duration_timedelta = stop_datetime-start_datetime
-        duration_hours, remainder = divmod(duration_timedelta.seconds, 3600)
-        duration_minutes, _ = divmod(remainder, 60)
+        # total_seconds() rather than .seconds which silently drops whole days
+        # for slots that span midnight.
+        duration_seconds = int((stop_datetime-start_datetime).total_seconds())
+        duration_hours, duration_minutes = divmod(duration_seconds // 60, 60)
         day_of_week = start_datetime.weekday()  # where Monday is 0 and Sunday is 6
 
         # We cannot charge for more than 8 hours 59 mins
@@ -434,81 +573,87 @@ class MyEnergi(object):
         """@brief Get the day of the week string used in the command sent to the myenergi server.
            @param day_of_week A single day of the week as an integer 0 - 6.
            @return The day of the week string in the format accepted by the myenergi server."""
-        day_of_week_string = None
-        if day_of_week == 0:
-            day_of_week_string = "01000000"
-
-        elif day_of_week == 1:
-            day_of_week_string = "00100000"
-
-        elif day_of_week == 2:
-            day_of_week_string = "00010000"
-
-        elif day_of_week == 3:
-            day_of_week_string = "00001000"
-
-        elif day_of_week == 4:
-            day_of_week_string = "00000100"
-
-        elif day_of_week == 5:
-            day_of_week_string = "00000010"
-
-        elif day_of_week == 6:
-            day_of_week_string = "00000001"
-
-        if day_of_week_string is None:
-            raise Exception("{day_of_week} is an invalid day of the week. Must be 0-6")
-
-        return day_of_week_string
+        if not 0 <= day_of_week <= 6:
+            raise Exception(f"{day_of_week} is an invalid day of the week. Must be 0-6")
+        return MyEnergi._DOW_STRINGS[day_of_week]
 
     def _debug(self, msg):
         if self._uio:
             self._uio.debug(f"myenergi API DEBUG: {msg}")
 
+    def _debug_enabled(self):
+        """@return True if debug messages will be displayed."""
+        if self._uio is None:
+            return False
+        is_debug = getattr(self._uio, 'isDebugEnabled', None)
+        if callable(is_debug):
+            return is_debug()
+        return True
+
+    @staticmethod
+    def _pretty_json(elem):
+        """@return The element pretty printed as a JSON string with sorted keys."""
+        if orjson:
+            return orjson.dumps(elem, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2).decode()
+        return json.dumps(elem, sort_keys=True, indent=4)
+
     def _exec_api_cmd(self, url):
         """@brief Run a command using the myenergi api and check for errors.
            @return The json response message."""
-        # As this maybe called from multiple threads ensure we use acquire a thread lock each time
-        # we communicate with the myenergi server.
-        with self._lock:
-            self._debug(f"_exec_api_cmd: url={url}")
-            response = requests.get(url, auth=HTTPDigestAuth(self._eddi_serial_number, self._api_key))
-            if response.status_code != 200:
-                raise Exception(f"{response.status_code} error code returned from myenergi server.")
-            self._debug(f"_exec_api_cmd: response.status_code={response.status_code}")
+        # The pooled session is thread safe so no lock is required around the network I/O.
+        # self._lock is only held while the stats dicts are updated (see update_stats()).
+        self._debug(f"_exec_api_cmd: url={url}")
+        if self._auth is None:
+            self._auth = HTTPDigestAuth(self._eddi_serial_number, self._api_key)
+        response = self._session.get(url, auth=self._auth, timeout=(3.05, 10))
+        if response.status_code != 200:
+            raise Exception(f"{response.status_code} error code returned from myenergi server.")
+        self._debug(f"_exec_api_cmd: response.status_code={response.status_code}")
+        if orjson:
+            response_dict = orjson.loads(response.content)
+        else:
             response_dict = response.json()
 
-            if response_dict:
+        if response_dict:
+            # Only pay the cost of pretty printing every element when the output will
+            # actually be shown.
+            if self._debug_enabled():
                 index = 0
                 for elem in response_dict:
-                    pstr = json.dumps(elem, sort_keys=True, indent=4)
+                    pstr = self._pretty_json(elem)
                     self._debug(f"_exec_api_cmd: index={index}, elem={pstr}")
                     index = index+1
 
-                if 'status' in response_dict and response_dict['status'] != 0:
-                    raise Exception(f"{response_dict['status']} status code returned from myenergi server (should be 0).")
+            # Note the response may be a list (E.G cgi-jstatus-*) in which case an
+            # 'in' test would search the elements rather than look for a status key.
+            if isinstance(response_dict, dict):
+                status = response_dict.get('status', 0)
+                if status != 0:
+                    raise Exception(f"{status} status code returned from myenergi server (should be 0).")
 
         return response_dict
 
+    def set_zappi_mode(self, mode):
+        """@brief Set the mode of the zappi charger.
+           @param mode One of the ZAPPI_CHARG*_MODE constants."""
+        self._check_zappi_serial_number()
+        self._exec_api_cmd(self._zappi_mode_urls[mode])
+
     def set_zappi_mode_fast_charge(self):
         """@brief Set the mode of the zappi charger to fast charge."""
-        url = MyEnergi.BASE_URL + f"cgi-zappi-mode-Z{self._zappi_serial_number}-1-0-0-0000"
-        self._exec_api_cmd(url)
+        self.set_zappi_mode(MyEnergi.ZAPPI_CHARG_MODE_FAST)
 
     def set_zappi_mode_eco(self):
         """@brief Set the mode of the zappi charger to eco"""
-        url = MyEnergi.BASE_URL + f"cgi-zappi-mode-Z{self._zappi_serial_number}-2-0-0-0000"
-        self._exec_api_cmd(url)
+        self.set_zappi_mode(MyEnergi.ZAPPI_CHARGE_MODE_ECO)
 
     def set_zappi_mode_eco_plus(self):
         """@brief Set the mode of the zappi charger to eco+"""
-        url = MyEnergi.BASE_URL + f"cgi-zappi-mode-Z{self._zappi_serial_number}-3-0-0-0000"
-        self._exec_api_cmd(url)
+        self.set_zappi_mode(MyEnergi.ZAPPI_CHARGE_MODE_ECO_PLUS)
 
     def set_zappi_mode_stop(self):
         """@brief Set the mode of the zappi charger to stop"""
-        url = MyEnergi.BASE_URL + f"cgi-zappi-mode-Z{self._zappi_serial_number}-4-0-0-0000"
-        self._exec_api_cmd(url)
+        self.set_zappi_mode(MyEnergi.ZAPPI_CHARGE_MODE_STOPPED)
 
     def set_zappi_charge_schedule(self, charge_slot_dict_list):
         """@brief Set the charge schedule for the zappi.
@@ -530,10 +675,11 @@ class MyEnergi(object):
         # The zappi charger must be in eco+ mode.
         # We don't need to set eco+ mode as this is checked at a higher level
 
-        # Set each schedule.
-        for charge_str in charge_str_list:
-            url = MyEnergi.BASE_URL + f"cgi-boost-time-Z{self._zappi_serial_number}-"+charge_str
-            self._exec_api_cmd(url)
+        # Set each schedule. The per slot commands are independent so issue them
+        # concurrently over the pooled session rather than paying one round trip each.
+        url_list = [f"{self._zappi_sched_prefix}-{charge_str}" for charge_str in charge_str_list]
+        # list() forces any exception raised by a command to propagate to the caller.
+        list(self._executor.map(self._exec_api_cmd, url_list))
 
     def get_zappi_ev_charge_kwh(self):
         """@return Get the EV charge since the car was plugged in."""
@@ -579,6 +725,8 @@ class RegionalElectricity(object):
     """@brief Responsible for reading and processing octopus agile tariff data.
     """
     VALID_REGION_CODE_LIST = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'J', 'K', 'L', 'M', 'N', 'P']
+    # frozenset of the above for O(1) membership checks. The list keeps the display order.
+    VALID_REGION_CODES = frozenset(VALID_REGION_CODE_LIST)
     VALID_REGION_CODE_LIST_WITH_REGIONS = ['A Eastern England',
                                            'B East Midlands',
                                            'C London',
@@ -593,11 +741,25 @@ class RegionalElectricity(object):
                                            'M Yorkshire',
                                            'N Southern Scotland',
                                            'P Northern Scotland']
+    # frozenset of the above for O(1) membership checks when validating user input.
+    VALID_REGION_CODE_SET_WITH_REGIONS = frozenset(VALID_REGION_CODE_LIST_WITH_REGIONS)
     BOKEH_TOOLS = "box_zoom,reset,save,box_select"
     SLOT_START_DATETIME = "SLOT_START_DATETIME"
     SLOT_STOP_DATETIME = "SLOT_STOP_DATETIME"
     SLOT_COST = "SLOT_COST"
 
+    COST_DICT_CACHE_SECONDS = 1800          # The max age of cached Octopus tariff data.
+    # Fetched tariff data is also saved here so a restart does not need to hit the
+    # Octopus server again while the cached data is still fresh.
+    TARIFF_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "myenergi_display")
+    # A single session shared by all instances so the connection to the Octopus server is reused.
+    _COST_SESSION = requests.Session()
+    _COST_SESSION.mount('https://', HTTPAdapter(pool_maxsize=4))
+    # region code -> (fetch time, cost dict). Guarded by _COST_CACHE_LOCK so concurrent
+    # GUI threads can't stampede the Octopus server when the cache expires.
+    _COST_CACHE = {}
+    _COST_CACHE_LOCK = threading.Lock()
+
     @staticmethod
     def GET_NEXT_30_MIN_TIME():
         """@brief Get the next time on a 30 minute boundary. On the hour or half hour.
@@ -634,34 +796,115 @@ class RegionalElectricity(object):
         self._uio = uio
 
     def _get_cost_dict(self, region_code):
-        """@brief Get a dict of the cost of electricity based on region. See https://mysmartenergy.uk/Electricity-Region for region code list."""
-        if region_code not in RegionalElectricity.VALID_REGION_CODE_LIST:
+        """@brief Get the cost of electricity based on region. See https://mysmartenergy.uk/Electricity-Region for region code list.
+                  The result is cached for COST_DICT_CACHE_SECONDS as the Octopus tariff data only changes a couple of times a day.
+                  get_prices() filters out any slots that are in the past so serving slightly old data here is safe.
+           @return A tuple containing
+                   0: A dict of slot start datetime to cost.
+                   1: The slot start datetimes in ascending order. This is built once
+                      here so get_prices() does not re-sort on every call."""
+        if region_code not in RegionalElectricity.VALID_REGION_CODES:
             raise Exception(f'{region_code} is an invalid region code ({",".join(RegionalElectricity.VALID_REGION_CODE_LIST)} are valid).')
 
-        # Note the link https://api.octopus.energy/v1/products/?search=AGILE lists the currently valid AGILE tariffs.
-        # This is useful if the link below stops working.
+        # The lock is held across the fetch so that concurrent GUI threads wait for one
+        # fetch to complete rather than all hitting the Octopus server at once.
+        with RegionalElectricity._COST_CACHE_LOCK:
+            cache_entry = RegionalElectricity._COST_CACHE.get(region_code)
+            if cache_entry and time() - cache_entry[0] < RegionalElectricity.COST_DICT_CACHE_SECONDS:
+                return (cache_entry[1], cache_entry[2])
 
-        # Get the energy prices for the next 24 hours or as much as we can obtain at this point in the day.
-        now = datetime.now().astimezone()
-        startt = RegionalElectricity.NEXT_15_MIN_BOUNDARY(dt=now)
-        endt = startt + timedelta(hours=24)
-        startts = startt.strftime("%Y-%m-%dT%H:%MZ")
-        endts = endt.strftime("%Y-%m-%dT%H:%MZ")
-        url_str = f'https://api.octopus.energy/v1/products/AGILE-24-10-01/electricity-tariffs/E-1R-AGILE-24-10-01-{region_code}/standard-unit-rates/?period_from={startts}&period_to={endts}'
-        # E.G
-        # https://api.octopus.energy/v1/products/AGILE-24-10-01/electricity-tariffs/E-1R-AGILE-24-10-01-A/standard-unit-rates/?period_from=2025-12-23T00:00Z&period_to=2025-12-23T23:30Z
-
-        self._uio.debug(f"Energy cost request URL: {url_str}")
-        with urllib.request.urlopen(url_str) as url:
-            data = json.load(url)
-
-        resultsDict = data['results']
-        costDict = {}
-        for record in resultsDict:
-            costPence = record["value_inc_vat"]
-            startT = datetime.strptime(record["valid_from"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-            costDict[startT] = costPence
-        return costDict
+            # On a cold in memory cache (E.G just after a restart) try the copy
+            # saved to disk by the last fetch before hitting the Octopus server.
+            if cache_entry is None:
+                disk_entry = self._load_cost_dict_from_disk(region_code)
+                if disk_entry is not None:
+                    return disk_entry
+
+            # Note the link https://api.octopus.energy/v1/products/?search=AGILE lists the currently valid AGILE tariffs.
+            # This is useful if the link below stops working.
+
+            # Get the energy prices for the next 24 hours or as much as we can obtain at this point in the day.
+            now = datetime.now().astimezone()
+            startt = RegionalElectricity.NEXT_15_MIN_BOUNDARY(dt=now)
+            endt = startt + timedelta(hours=24)
+            startts = startt.strftime("%Y-%m-%dT%H:%MZ")
+            endts = endt.strftime("%Y-%m-%dT%H:%MZ")
+            url_str = f'https://api.octopus.energy/v1/products/AGILE-24-10-01/electricity-tariffs/E-1R-AGILE-24-10-01-{region_code}/standard-unit-rates/?period_from={startts}&period_to={endts}'
+            # E.G
+            # https://api.octopus.energy/v1/products/AGILE-24-10-01/electricity-tariffs/E-1R-AGILE-24-10-01-A/standard-unit-rates/?period_from=2025-12-23T00:00Z&period_to=2025-12-23T23:30Z
+
+            self._uio.debug(f"Energy cost request URL: {url_str}")
+            response = RegionalElectricity._COST_SESSION.get(url_str, timeout=(3.05, 10))
+            if response.status_code != 200:
+                raise Exception(f"{response.status_code} error code returned from the Octopus server.")
+            if orjson:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
+
+            resultsDict = data['results']
+            parse = RegionalElectricity._parse_octopus_timestamp
+            costDict = {parse(record["valid_from"]): record["value_inc_vat"] for record in resultsDict}
+            sorted_ts = sorted(costDict)
+            fetched_at = time()
+            RegionalElectricity._COST_CACHE[region_code] = (fetched_at, costDict, sorted_ts)
+            self._save_cost_dict_to_disk(region_code, fetched_at, resultsDict)
+        return (costDict, sorted_ts)
+
+    @staticmethod
+    def _get_tariff_cache_file(region_code):
+        """@brief Get the file used to persist tariff data for a region.
+           @param region_code The single letter electricity region code.
+           @return The absolute file path."""
+        return os.path.join(RegionalElectricity.TARIFF_DISK_CACHE_DIR, f"tariff-{region_code}.json")
+
+    def _save_cost_dict_to_disk(self, region_code, fetched_at, resultsDict):
+        """@brief Save the raw tariff records to disk so a restart can reuse them.
+                  Failure to save is not an error, the data will just be fetched again.
+           @param region_code The single letter electricity region code.
+           @param fetched_at The time the data was read from the Octopus server.
+           @param resultsDict The results list as returned by the Octopus server."""
+        try:
+            os.makedirs(RegionalElectricity.TARIFF_DISK_CACHE_DIR, exist_ok=True)
+            with open(RegionalElectricity._get_tariff_cache_file(region_code), 'w') as fd:
+                json.dump({'fetched_at': fetched_at, 'results': resultsDict}, fd)
+        except Exception:
+            pass
+
+    def _load_cost_dict_from_disk(self, region_code):
+        """@brief Attempt to load still fresh tariff data saved by a previous run.
+                  The in memory cache is populated on success so subsequent calls do
+                  not touch the disk.
+           @param region_code The single letter electricity region code.
+           @return A (cost dict, sorted timestamp list) tuple or None if no fresh
+                   data is available on disk."""
+        try:
+            with open(RegionalElectricity._get_tariff_cache_file(region_code)) as fd:
+                saved = json.load(fd)
+            fetched_at = saved['fetched_at']
+            if time() - fetched_at >= RegionalElectricity.COST_DICT_CACHE_SECONDS:
+                return None
+            parse = RegionalElectricity._parse_octopus_timestamp
+            costDict = {parse(record["valid_from"]): record["value_inc_vat"] for record in saved['results']}
+            sorted_ts = sorted(costDict)
+            RegionalElectricity._COST_CACHE[region_code] = (fetched_at, costDict, sorted_ts)
+            return (costDict, sorted_ts)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _parse_octopus_timestamp(ts_str):
+        """@brief Parse an Octopus API timestamp (E.G 2025-12-23T00:00:00Z).
+                  The format is fixed so the fields are sliced out directly which is an
+                  order of magnitude faster than datetime.strptime.
+           @param ts_str The timestamp string.
+           @return A datetime instance in UTC."""
+        return datetime(int(ts_str[0:4]),
+                        int(ts_str[5:7]),
+                        int(ts_str[8:10]),
+                        int(ts_str[11:13]),
+                        int(ts_str[14:16]),
+                        tzinfo=_UTC)
 
     def get_prices(self, region_code, end_charge_time):
         """@brief Get the price of electricity over the next day or so as a dict.
@@ -672,28 +915,23 @@ class RegionalElectricity(object):
                    1 = The price of electricity in £ in that 1/2 hour slot.
                    2 = The end of charge date time object or None if not defined."""
 
-        costDict = self._get_cost_dict(region_code)
+        costDict, _timeStampList = self._get_cost_dict(region_code)
         next_30_min_datetime = RegionalElectricity.GET_NEXT_30_MIN_TIME()
-        _timeStampList = list(costDict.keys())
-        _timeStampList.sort()
         # If the user requires the charge to be complete by a certain time
         end_charge_datetime = None
         if end_charge_time:
             end_charge_datetime = GUIServer.GET_END_CHARGE_DATETIME(end_charge_time)
 
-        timeStampList = []
-        costList = []
-        for ts in _timeStampList:
-            # Ignore all times that are in the past
-            if ts < next_30_min_datetime:
-                continue
-            # Ignore times after the end charge time
-            if end_charge_datetime and ts > end_charge_datetime:
-                continue
-            timeStampList.append(ts)
-            cost = costDict[ts]/100.0
-            # Add the end of this 1/2 hour slot
-            costList.append(cost)
+        # The timestamps are sorted so the in range window (ignoring times in the
+        # past and after the end charge time) can be sliced out with two binary
+        # searches rather than a per element scan.
+        low = bisect_left(_timeStampList, next_30_min_datetime)
+        if end_charge_datetime:
+            high = bisect_right(_timeStampList, end_charge_datetime)
+        else:
+            high = len(_timeStampList)
+        timeStampList = _timeStampList[low:high]
+        costList = [costDict[ts]*0.01 for ts in timeStampList]
 
         # If we don't have an end of charge time defined
         if not end_charge_datetime:
@@ -739,6 +977,33 @@ class GUIServer(object):
                       UNDERSHOOT_CHARGE: False}
 
     TAB_BAR_STYLE = 'font-size: 20px; color: lightgreen;'
+    BIND_ADDRESS = "0.0.0.0"
+    # The fixed part of the tariff plot layout. Only the y axis range varies per
+    # plot and is merged in by _plot_tariff.
+    _TARIFF_PLOT_LAYOUT = dict(margin=dict(l=0, r=0, t=0, b=0),
+                               width=350,
+                               height=150,
+                               showlegend=False,
+                               plot_bgcolor="black",       # Background for the plot area
+                               paper_bgcolor="black",      # Background for the entire figure
+                               font=dict(color="yellow"),  # Font color for labels and title
+                               xaxis=dict(
+                                   title='Day (HH:MM)',
+                                   tickformat='%H:%M',     # Format as hours:minutes
+                                   color="yellow",         # Axis label color
+                                   gridcolor="gray",       # Gridline color
+                                   zerolinecolor="gray"    # Zero line color
+                               ),
+                               yaxis=dict(
+                                   title="£ per kWh",
+                                   color="yellow",         # Axis label color
+                                   gridcolor="gray",       # Gridline color
+                                   zerolinecolor="gray"    # Zero line color
+                               ))
+    # (tab name, tab icon, tab init method name) for each GUI tab.
+    TAB_SPEC = (('EDDI', 'home', '_init_eddi_tab'),
+                ('ZAPPI', 'electric_car', '_init_zappi_tab'),
+                ('SETTINGS', 'settings', '_init_settings_tab'))
     TEXT_STYLE_A = 'font-size: 40px; color: white;'
     TEXT_STYLE_A_SIZE = 'font-size: 20px;'
     TEXT_STYLE_B = 'font-size: 40px; color: lightgreen;'
@@ -749,7 +1014,7 @@ class GUIServer(object):
     BOOST_1_ON = "BOOST_1_SET_ON"
     BOOST_2_ON = "BOOST_2_SET_ON"
     BOOST_OFF = "BOOST_OFF"
-    TANK_TEMPERATURES = "TANK_TEMPERATURES"
+    STATS_UPDATE = "STATS_UPDATE"
     INFO_MESSAGE = "INFO_MESSAGE"
     ERROR_MESSAGE = "ERROR_MESSAGE"
     WARNING_MESSAGE = "WARNING_MESSAGE"
@@ -759,7 +1024,9 @@ class GUIServer(object):
     STATS_READ_INC_FACTOR = 1.2                     # Choose a factor that will cause the stats read delay to reach maximum in about 6 minutes.
     DEFAULT_SERVER_PORT = 8080
     GUI_POLL_SECONDS = 0.1
-    TARIFF_LIST = ["Octopus Agile Tariff", 'Other Tariff']
+    MAX_GUI_MESSAGES_PER_TICK = 32                  # The max messages processed per GUI timer tick.
+    CHARGE_SLOT_MINS = 30.0                         # Both tariff sources supply fixed 30 minute slots.
+    TARIFF_LIST = ("Octopus Agile Tariff", 'Other Tariff')
     SET_ZAPPI_CHARGE_SCHEDULE_MESSAGE = "Set zappi charge schedule"
     DEFAULT_BUTTON_COLOR = "blue"
     CLEARED_ALL_CHARGING_SCHEDULES = "Cleared all zappi charging schedules."
@@ -774,15 +1041,22 @@ class GUIServer(object):
     BSM_BOOST_DICT_KEY = 'bsm'
     SLT_BOOST_DICT_KEY = 'slt'
 
-    BOOST_DICT_KEYS = [BDD_BOOST_DICT_KEY,
+    BOOST_DICT_KEYS = (BDD_BOOST_DICT_KEY,
                        BDH_BOOST_DICT_KEY,
                        BDM_BOOST_DICT_KEY,
                        BSH_BOOST_DICT_KEY,
                        BSM_BOOST_DICT_KEY,
                        SLT_BOOST_DICT_KEY
-                       ]
+                       )
     PLOT_OPTIMAL_CHARGE_TIMES = "PLOT_OPTIMAL_CHARGE_TIMES"
 
+    # Message types where only the latest queued value matters. When a burst of
+    # messages lands (E.G after a network stall) the stale ones are dropped rather
+    # than causing redundant GUI updates. Notify style messages are never dropped.
+    _COALESCED_MESSAGE_KEYS = frozenset((STATS_UPDATE,
+                                         ZAPPI_CHARGE_SCHEDULE,
+                                         PLOT_OPTIMAL_CHARGE_TIMES))
+
     BUTTON_LOW_INDEX = 0
     BUTTON_MID_INDEX = 1
     BUTTON_HIGH_INDEX = 2
@@ -797,20 +1071,23 @@ class GUIServer(object):
     MIN_HEATER_WATTS = 100
 
     ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT = "ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT"
+    POLL_BACKOFF_BASE_FLOAT = "POLL_BACKOFF_BASE_FLOAT"
     CMD_LINE_CONFIG_FILENAME = "myenergi_display_command_line.cfg"
     DEFAULT_CMD_LINE_CONFIG = {
         ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT: "1.0",
+        POLL_BACKOFF_BASE_FLOAT: str(STATS_READ_INC_FACTOR),
     }
     CMD_LINE_CONFIG_ATTR_DICT = {
         ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT: ConfigAttrDetails("Enter the ZAPPI charge adjustment factor (default = 1.0)", 0.0, 3.0),
+        POLL_BACKOFF_BASE_FLOAT: ConfigAttrDetails(f"Enter the stats poll backoff base (default = {STATS_READ_INC_FACTOR})", 1.0, 3.0),
     }
 
     @staticmethod
     def Print_Exception():
         """@brief Print an exception traceback."""
-        lines = traceback.format_exc().split("\n")
-        for line in lines:
-            print(line)
+        # Writes the traceback directly rather than formatting to a string,
+        # splitting and printing line by line.
+        traceback.print_exc()
 
     def __init__(self, uio, port):
         """@brief Constructor
@@ -819,143 +1096,259 @@ class GUIServer(object):
         self._uio = uio
         self._port = port
         self._init_stats_read_delay = True            # A flag to initialize the stats read time
-        self._to_gui_queue = Queue()    # This queue is used to send commands from any thread to the GUI thread.
-        self._my_energi = MyEnergi('')
+        # This queue is used to send commands from any thread to the GUI thread.
+        # SimpleQueue is C implemented and cheaper than Queue for this unbounded
+        # producer -> consumer hand-off which never blocks.
+        self._to_gui_queue = SimpleQueue()
+        self._my_energi = MyEnergi('', uio=self._uio)
+        # A persistent instance used by the settings tab access checks so that
+        # consecutive checks reuse the same pooled HTTP connections.
+        self._check_myenergi = None
         self._heater_load_watts = 0
         self._zappi_charge_watts = 0
         self._relay_on = 0
         self._eddi_heater_button_selected = 0
+        self._eddi_config_ok = False
+        # The last (top, bottom, heater W, zappi W, relay) stats read, used to
+        # reset the poll rate ramp when the device state changes.
+        self._last_stats_tuple = None
         self._electricity_region_code = ''
         self._charge_slot_dict_list = None
         self._octopus_agile_tariff = True
         self._other_tariff_values = []
-        self._read_temp_thread = None
+        # Cached result of _get_tariff() plus the tariff version it was built from.
+        # The version is bumped whenever the tariff values change.
+        self._tariff_ver = 0
+        self._tariff_cache = None
+        self._tariff_cache_ver = -1
+        # Sorted minute-of-day keys and matching prices for binary price lookups.
+        self._tariff_minutes = []
+        self._tariff_prices = []
+        # (date, half hour interval list) cache used by the tariff plot.
+        self._plot_intervals_cache = (None, None)
+        # Memoized minute-of-day to price lookups, dropped when the tariff changes.
+        self._price_memo = {}
+        self._price_memo_ver = -1
+        # The (tariff version, date) last rendered by _plot_tariff() so that no-op
+        # renders (E.G tab switches) can skip the plotly figure rebuild.
+        self._last_plot_key = (None, None)
+        # A single worker executor for reading stats from the myenergi server.
+        # The semaphore is a race free try-acquire gate that caps in flight
+        # stats reads at one; it is released when the read completes.
+        self._stats_executor = ThreadPoolExecutor(max_workers=1)
+        self._stats_sem = threading.BoundedSemaphore(1)
+        atexit.register(self._stats_executor.shutdown)
         self._zappi_charge_schedule_active = False
         self._clear_zappi_button = None
+        # Last color index sent to the boost top/bottom and set buttons so the GUI
+        # timer only sends set_color_index updates when the color changes.
+        self._last_color_idx = [None, None, None]
+        # Message key -> handler dispatch table used by _process_rx_dict. The
+        # GUI_POLL_SECONDS key added to every message by _update_gui has no handler
+        # and is therefore skipped.
+        self._msg_handlers = {
+            GUIServer.BOOST_1_ON: self._on_boost_1_on,
+            GUIServer.BOOST_2_ON: self._on_boost_2_on,
+            GUIServer.BOOST_OFF: self._on_boost_off,
+            GUIServer.ERROR_MESSAGE: self._on_error_message,
+            GUIServer.INFO_MESSAGE: self._on_info_message,
+            GUIServer.STATS_UPDATE: self._on_stats_update,
+            GUIServer.ZAPPI_CHARGE_SCHEDULE: self._on_zappi_charge_schedule,
+            GUIServer.PLOT_OPTIMAL_CHARGE_TIMES: self._on_plot_optimal_charge_times,
+            GUIServer.CLEAR_PLOT: self._on_clear_plot,
+            GUIServer.ZAPPI_CHARGE_COMPLETE_MESSAGE: self._on_zappi_charge_complete,
+            GUIServer.WARNING_MESSAGE: self._on_warning_message,
+        }
         self._start_charge_zappi_kwh = 0.0
         self._target_ev_charge_kwh = 0.0
         self._cfg_mgr = DotConfigManager(GUIServer.DEFAULT_CONFIG, uio=self._uio)
+        # In memory shadow of the config. All reads come from this dict so the
+        # config manager is only touched when a value is first read or changed.
+        # Changed values accumulate in _cfg_pending until the next store.
+        self._cfg = {}
+        self._cfg_pending = {}
         self._load_config()
         # Attr used to convert boost time slider seconds into HH:MM
         self._boost_time_value = None
+        # (raw config string, parsed datetime) caches for the clear schedule times so the
+        # 10 Hz GUI timer does not re-parse an unchanged config value on every tick.
+        self._clear_eddi_dt_cache = (None, None)
+        self._clear_zappi_dt_cache = (None, None)
         self._cmd_line_config_manager = ConfigManager(self._uio, GUIServer.CMD_LINE_CONFIG_FILENAME, GUIServer.DEFAULT_CMD_LINE_CONFIG)
         self._cmd_line_config_manager.load(self)
+        # A single long lived worker thread executes background jobs in order rather
+        # than spawning a new thread per job. This bounds memory if the myenergi
+        # server becomes unreachable and guarantees dependent jobs run in sequence.
+        self._bg_queue = Queue()
+        threading.Thread(target=self._bg_worker, daemon=True).start()
+        try:
+            self._poll_backoff_base = float(self._cmd_line_config_manager.getAttr(GUIServer.POLL_BACKOFF_BASE_FLOAT))
+        except Exception:
+            self._poll_backoff_base = GUIServer.STATS_READ_INC_FACTOR
+
+    def _bg_worker(self):
+        """@brief Execute jobs from the background job queue, one at a time, forever."""
+        while True:
+            fn, args = self._bg_queue.get()
+            try:
+                fn(*args)
+            except Exception:
+                GUIServer.Print_Exception()
+
+    def _run_in_background(self, fn, *args):
+        """@brief Queue a job for execution on the background worker thread.
+           @param fn The callable to execute.
+           @param args The arguments to pass to the callable."""
+        self._bg_queue.put((fn, args))
 
     def _reset_polling_rate(self):
         """@brief This is called to reset the polling rate (set to min delay between reads)."""
         self._init_stats_read_delay = True
+        # The user just changed something (boost/schedule/config) so the next read
+        # must fetch fresh values rather than serving the TTL cached stats.
+        self._my_energi.invalidate_stats_cache()
 
     def _read_stats_now(self):
         """@brief Determine if it's time to read the stats from the myenergi server.
+                  The delay between each read starts at GUIServer.MIN_STATS_UPDATE_SECONDS
+                  and ramps to GUIServer.MAX_STATS_UPDATE_SECONDS by the configurable
+                  backoff base as time passes.
            @return True if it's time, False if not."""
-        read_stats_now = False
+        now = time()
         if self._init_stats_read_delay:
             self._init_stats_read_delay = False
-            self._next_stats_read_time = time() + GUIServer.MIN_STATS_UPDATE_SECONDS
             self._current_stats_read_delay = GUIServer.MIN_STATS_UPDATE_SECONDS
-            read_stats_now = True
+            self._next_stats_read_time = now + self._current_stats_read_delay
             self._debug(f"self._read_stats_now(): Read stats {GUIServer.MIN_STATS_UPDATE_SECONDS} seconds from now.")
-
-        else:
-            # When running the stats are read from the myenergi server. The delay between
-            # each read starts at GUIServer.MIN_STATS_UPDATE_SECONDS and moves to
-            # GUIServer.MAX_STATS_UPDATE_SECONDS as time passes.
-
-            # If we are in a state where the read delay has reached the max, calc the next read time.
-            if self._current_stats_read_delay >= GUIServer.MAX_STATS_UPDATE_SECONDS:
-                self._current_stats_read_delay = GUIServer.MAX_STATS_UPDATE_SECONDS
-                # If its time to read stats
-                if time() >= self._next_stats_read_time:
-                    read_stats_now = True
-                    # Calc the next read time.
-                    self._next_stats_read_time = time() + self._current_stats_read_delay
-                    self._debug(f"self._read_stats_now(): Max stats read delay of {self._current_stats_read_delay} seconds reached.")
-
-            else:
-                # If its time to read stats
-                if time() >= self._next_stats_read_time:
-                    # Inc the delay between reads and calc the next read time.
-                    new_stats_read_delay = self._current_stats_read_delay * GUIServer.STATS_READ_INC_FACTOR
-                    self._next_stats_read_time = time() + new_stats_read_delay
-                    read_stats_now = True
-                    self._current_stats_read_delay = new_stats_read_delay
-                    if self._current_stats_read_delay > GUIServer.MAX_STATS_UPDATE_SECONDS:
-                        self._current_stats_read_delay = GUIServer.MAX_STATS_UPDATE_SECONDS
-                    self._debug(f"self._read_stats_now(): Read stats in {self._current_stats_read_delay} seconds time.")
-
-        return read_stats_now
+            return True
+
+        # The common case on almost every GUI tick: not yet time to read.
+        if now < self._next_stats_read_time:
+            return False
+
+        # Ramp the delay between reads towards the max and calc the next read time.
+        self._current_stats_read_delay = min(self._current_stats_read_delay * self._poll_backoff_base,
+                                             GUIServer.MAX_STATS_UPDATE_SECONDS)
+        self._next_stats_read_time = now + self._current_stats_read_delay
+        self._debug(f"self._read_stats_now(): Read stats in {self._current_stats_read_delay} seconds time.")
+        return True
+
+    def _get_cfg(self, key):
+        """@brief Get a config value from the in memory shadow of the config.
+           @param key The config key.
+           @return The config value."""
+        if key not in self._cfg:
+            self._cfg[key] = self._cfg_mgr.getAttr(key)
+        return self._cfg[key]
+
+    def _set_cfg(self, key, value):
+        """@brief Set a config value in the in memory shadow. Changed values are
+                  batched and flushed to the config manager and disk on the next
+                  _store_config() call.
+           @param key The config key.
+           @param value The value to set."""
+        if key not in self._cfg or self._cfg[key] != value:
+            self._cfg[key] = value
+            self._cfg_pending[key] = value
+
+    def _store_config(self):
+        """@brief Flush batched config changes to the config manager and persist to
+                  disk. A no-op if nothing changed since the last store."""
+        if self._cfg_pending:
+            # Swap the pending dict out atomically. _set_cfg may run on another
+            # thread (E.G the GUI thread) while this flush runs on the background
+            # worker; iterating the live dict could raise or lose a value set
+            # between the iteration and a clear().
+            pending, self._cfg_pending = self._cfg_pending, {}
+            for key, value in pending.items():
+                self._cfg_mgr.addAttr(key, value)
+            self._cfg_mgr.store()
 
     def _load_config(self):
         """@brief Load the config from a config file."""
         try:
             self._cfg_mgr.load()
+            self._cfg.clear()
+            self._cfg_pending.clear()
             self._create_myenergi()
-            self._other_tariff_values = self._cfg_mgr.getAttr(GUIServer.TARIFF_POINT_LIST)
+            self._other_tariff_values = self._get_cfg(GUIServer.TARIFF_POINT_LIST)
+            self._tariff_ver += 1
 
         except Exception:
             # If config does not exist we use the defaults
             pass
 
     def _create_myenergi(self):
-        """@brief Create an object to talk to the myenergi products."""
-        self._my_energi = MyEnergi(self._cfg_mgr.getAttr(GUIServer.MYENERGI_API_KEY), uio=self._uio)
-        self._my_energi.set_eddi_serial_number(self._cfg_mgr.getAttr(GUIServer.EDDI_SERIAL_NUMBER))
-        self._my_energi.set_zappi_serial_number(self._cfg_mgr.getAttr(GUIServer.ZAPPI_SERIAL_NUMBER))
+        """@brief Create or reconfigure the object used to talk to the myenergi products.
+                  An existing instance has its credentials updated in place so that its
+                  pooled HTTP connections to the myenergi server are kept open."""
+        api_key = self._get_cfg(GUIServer.MYENERGI_API_KEY)
+        eddi_serial_number = self._get_cfg(GUIServer.EDDI_SERIAL_NUMBER)
+        zappi_serial_number = self._get_cfg(GUIServer.ZAPPI_SERIAL_NUMBER)
+        # The instance created in __init__ is always present so the credentials are
+        # updated in place, keeping its pooled HTTP connections open.
+        self._my_energi.update_credentials(api_key, eddi_serial_number, zappi_serial_number)
+        # Cache the eddi config check read on every periodic stats read. This is
+        # recomputed here because the config may just have changed.
+        self._eddi_config_ok = bool(api_key) and bool(eddi_serial_number)
 
     def _save_config(self, show_info=True):
         """@brief Save some parameters to a local config file.
+                  This may perform network (myenergi access checks) and disk I/O so it
+                  is run on the background worker thread, not in a nicegui event handler.
+                  All user feedback is sent through the GUI message queue.
            @param show_info If True then show info messages."""
 
         # If the API key and eddi serial number have been entered
         if len(self._api_key.value) > 0 and len(self._eddi_serial_number.value) > 0:
-            self._cfg_mgr.addAttr(GUIServer.MYENERGI_API_KEY,    self._api_key.value)
-            self._cfg_mgr.addAttr(GUIServer.EDDI_SERIAL_NUMBER,  self._eddi_serial_number.value)
+            self._set_cfg(GUIServer.MYENERGI_API_KEY,    self._api_key.value)
+            self._set_cfg(GUIServer.EDDI_SERIAL_NUMBER,  self._eddi_serial_number.value)
             if not self._check_eddi_access_ok(show_info=show_info):
                 return
 
         # If the API key and zappi serial number have been entered
         if len(self._api_key.value) > 0 and len(self._zappi_serial_number.value) > 0:
-            self._cfg_mgr.addAttr(GUIServer.MYENERGI_API_KEY,    self._api_key.value)
-            self._cfg_mgr.addAttr(GUIServer.ZAPPI_SERIAL_NUMBER, self._zappi_serial_number.value)
+            self._set_cfg(GUIServer.MYENERGI_API_KEY,    self._api_key.value)
+            self._set_cfg(GUIServer.ZAPPI_SERIAL_NUMBER, self._zappi_serial_number.value)
             if not self._check_zappi_access_ok(show_info=show_info):
-                ui.notify("zappi access failed. Check API Key and zappi serial number.", type='negative')
+                self._update_gui({GUIServer.ERROR_MESSAGE: "zappi access failed. Check API Key and zappi serial number."})
                 return
 
             if float(self._ev_kwh.value) <= 0:
-                ui.notify("EV battery capacity must be greater than 0 kWh.", type='negative')
+                self._update_gui({GUIServer.ERROR_MESSAGE: "EV battery capacity must be greater than 0 kWh."})
                 return
-            self._cfg_mgr.addAttr(GUIServer.EV_BATTERY_KWH, float(self._ev_kwh.value))
+            self._set_cfg(GUIServer.EV_BATTERY_KWH, float(self._ev_kwh.value))
 
             region_code = self._electricity_region_code.value
-            if region_code is None or region_code not in RegionalElectricity.VALID_REGION_CODE_LIST_WITH_REGIONS:
-                ui.notify("Electricity region code must be set.", type='negative')
+            if region_code is None or region_code not in RegionalElectricity.VALID_REGION_CODE_SET_WITH_REGIONS:
+                self._update_gui({GUIServer.ERROR_MESSAGE: "Electricity region code must be set."})
                 return
-            self._cfg_mgr.addAttr(GUIServer.ELECTRICITY_REGION_CODE, region_code)
+            self._set_cfg(GUIServer.ELECTRICITY_REGION_CODE, region_code)
 
             # The user may leave the zappi charge rate field empty
             if len(self._zappi_max_charge_rate.value) > 0:
                 try:
                     float(self._zappi_max_charge_rate.value)
                 except ValueError:
-                    ui.notify(f"{self._zappi_max_charge_rate.value} is an invalid zappi charge rate (kW).", type='negative')
+                    self._update_gui({GUIServer.ERROR_MESSAGE: f"{self._zappi_max_charge_rate.value} is an invalid zappi charge rate (kW)."})
                     # Don't proceed with saving
                     return
-            self._cfg_mgr.addAttr(GUIServer.ZAPPI_MAX_CHARGE_RATE, self._zappi_max_charge_rate.value)
+            self._set_cfg(GUIServer.ZAPPI_MAX_CHARGE_RATE, self._zappi_max_charge_rate.value)
 
             octopus_agile_tariff = self._is_octopus_agile_tariff_enabled()
-            self._cfg_mgr.addAttr(GUIServer.OCTOPUS_AGILE_TARIFF, octopus_agile_tariff)
-            self._cfg_mgr.addAttr(GUIServer.TARIFF_POINT_LIST, self._other_tariff_values)
+            self._set_cfg(GUIServer.OCTOPUS_AGILE_TARIFF, octopus_agile_tariff)
+            self._set_cfg(GUIServer.TARIFF_POINT_LIST, self._other_tariff_values)
 
         # These are GUI fields that are saved persistently.
-        self._cfg_mgr.addAttr(GUIServer.CURRENT_EV_CHARGE_PERCENTAGE, self._current_ev_charge_input.value)
-        self._cfg_mgr.addAttr(GUIServer.TARGET_EV_CHARGE_PERCENTAGE, self._target_ev_charge_input.value)
-        self._cfg_mgr.addAttr(GUIServer.READY_BY, self._end_charge_time_input.value)
-        self._cfg_mgr.addAttr(GUIServer.UNDERSHOOT_CHARGE, self._undershoot_checkbox.value)
+        self._set_cfg(GUIServer.CURRENT_EV_CHARGE_PERCENTAGE, self._current_ev_charge_input.value)
+        self._set_cfg(GUIServer.TARGET_EV_CHARGE_PERCENTAGE, self._target_ev_charge_input.value)
+        self._set_cfg(GUIServer.READY_BY, self._end_charge_time_input.value)
+        self._set_cfg(GUIServer.UNDERSHOOT_CHARGE, self._undershoot_checkbox.value)
 
-        self._cfg_mgr.store()
+        self._store_config()
 
         if show_info:
-            ui.notify(f"Saved to {self._cfg_mgr._getConfigFile()}")
+            self._update_gui({GUIServer.INFO_MESSAGE: f"Saved to {self._cfg_mgr._getConfigFile()}"})
 
     def _is_octopus_agile_tariff_enabled(self):
         """@brief Determine if the user has selectedt the Octopus agile tariff.
@@ -987,39 +1380,29 @@ class GUIServer(object):
            @param show If True show the GUI on startup, ie open a browser window."""
         self._temp1 = 60
         self._temp2 = 40
-        self._buttonList = []
+        # Idempotent so a GUI rebuild does not drop buttons already registered.
+        if not hasattr(self, '_buttonList'):
+            self._buttonList = []
 
         pageTitle = f"myenergi display (V{TabbedNiceGui.GetProgramVersion()})"
-        address = "0.0.0.0"
-        tabNameList = ('EDDI',
-                       'ZAPPI',
-                       'SETTINGS')
-        iconList = ('home',
-                    'electric_car',
-                    'settings')
-        # This must have the same number of elements as the above list
-        tabMethodInitList = [self._init_eddi_tab,
-                             self._init_zappi_tab,
-                             self._init_settings_tab]
         tabObjList = []
         with ui.row().style(GUIServer.TAB_BAR_STYLE):
             with ui.tabs().classes('w-full') as tabs:
-                for tabName, iconName in zip(tabNameList, iconList):
+                for tabName, iconName, _ in GUIServer.TAB_SPEC:
                     tabObj = ui.tab(tabName, icon=iconName)
                     tabObjList.append(tabObj)
 
             with ui.tab_panels(tabs, value=tabObjList[0]).classes('w-full'):
-                for tabObj in tabObjList:
+                for tabObj, (_, _, initMethodName) in zip(tabObjList, GUIServer.TAB_SPEC):
                     with ui.tab_panel(tabObj):
-                        tabIndex = tabObjList.index(tabObj)
-                        tabMethodInitList[tabIndex]()
+                        getattr(self, initMethodName)()
 
         guiLogLevel = "warning"
         if nicegui_debug_enabled:
             guiLogLevel = "debug"
 
         ui.timer(interval=0.1, callback=self._gui_timer_callback)
-        ui.run(host=address,
+        ui.run(host=GUIServer.BIND_ADDRESS,
                port=self._port,
                title=pageTitle,
                dark=True,
@@ -1027,68 +1410,115 @@ class GUIServer(object):
                reload=reload,
                show=show)
 
-    def _get_heater_power(self, relay):
+    @staticmethod
+    def _get_heater_power(relay, relay_on, heater_load_watts):
         """@brief Determine how much power the heater is taking and from this infer the
-                  source of the power.
+                  source of the power. Static, taking the instance values as args, so
+                  the 10 Hz caller only pays the attribute lookups once for both relays.
            @param relay 1 == top tank heater. 2 == Bottom tank heater.
+           @param relay_on The relay currently on.
+           @param heater_load_watts The current heater load in watts.
            @return 2 >= AC Mains
                    1 >= Solar Power
                    0 = No detected power."""
         detected_power = 0
         # If the relay of interest is on
-        if self._relay_on == relay:
-            if self._heater_load_watts > GUIServer.MAX_HEATER_WATTS:
+        if relay_on == relay:
+            if heater_load_watts > GUIServer.MAX_HEATER_WATTS:
                 detected_power = 2
 
-            elif self._heater_load_watts > GUIServer.MIN_HEATER_WATTS:
+            elif heater_load_watts > GUIServer.MIN_HEATER_WATTS:
                 detected_power = 1
         return detected_power
 
-    def _get_zappi_charging(self):
+    @staticmethod
+    def _get_zappi_charging(zappi_charge_watts):
         """@brief Determine if the zappi is charging an EV.
+           @param zappi_charge_watts The current zappi charge load in watts.
            @return True if the EV is charging."""
-        ev_charging = False
         # We use a threshold of 1400 watts as 1500 watts appears to be the min ev charge rate.
-        if self._zappi_charge_watts > 1400:
-            ev_charging = True
-        return ev_charging
+        return zappi_charge_watts > 1400
 
     def _gui_timer_callback(self):
         """@called periodically (quickly) to allow updates of the GUI."""
 
-        while not self._to_gui_queue.empty():
-            rxMessage = self._to_gui_queue.get()
-            if isinstance(rxMessage, dict):
-                self._process_rx_dict(rxMessage)
+        # Drain the queue in one go rather than paying an empty() + get() lock
+        # round trip per message. The drain is capped so a burst of messages
+        # cannot hold up this 10 Hz callback, any overflow is handled next tick.
+        rx_message_list = []
+        try:
+            for _ in range(GUIServer.MAX_GUI_MESSAGES_PER_TICK):
+                rx_message_list.append(self._to_gui_queue.get_nowait())
+        except Empty:
+            pass
+
+        if rx_message_list:
+            # Find the last occurrence of each coalesced message type so stale
+            # duplicates in a burst can be skipped.
+            latest_index = {}
+            for index, rxMessage in enumerate(rx_message_list):
+                if isinstance(rxMessage, dict):
+                    for key in rxMessage:
+                        if key in GUIServer._COALESCED_MESSAGE_KEYS:
+                            latest_index[key] = index
+
+            for index, rxMessage in enumerate(rx_message_list):
+                if not isinstance(rxMessage, dict):
+                    continue
+                stale = False
+                for key in rxMessage:
+                    if key in GUIServer._COALESCED_MESSAGE_KEYS and latest_index[key] != index:
+                        stale = True
+                        break
+                if not stale:
+                    self._process_rx_dict(rxMessage)
 
         # If it's time toe read the stats
-        if self._read_stats_now():
+        if self._read_stats_now() and self._stats_sem.acquire(blocking=False):
             # Don't update the tank temperatures in the gui thread or the gui thread will block
             # if there are issues getting data over the internet.
-            # Only start a new thread if we haven't started one yet or the old one has completed.
-            # This stops many threads backing up if there are internet connectivity issues.
-            self._read_temp_thread = threading.Thread(target=self._update_stats).start()
+            # The semaphore only lets a new read start once the previous one has
+            # completed. This stops reads backing up if there are internet
+            # connectivity issues.
+            self._stats_executor.submit(self._run_update_stats)
 
-        relay_1_color_index = self._get_heater_power(1)
-        self._boost_top_button.set_color_index(relay_1_color_index)
+        # Hoist the instance attribute lookups shared by the checks below.
+        relay_on = self._relay_on
+        heater_load_watts = self._heater_load_watts
 
-        relay_2_color_index = self._get_heater_power(2)
+        relay_1_color_index = GUIServer._get_heater_power(1, relay_on, heater_load_watts)
+
+        relay_2_color_index = GUIServer._get_heater_power(2, relay_on, heater_load_watts)
         # Ensure both heaters cannot be on at the same time
         # This should never happen.
         if relay_1_color_index != 0:
             relay_2_color_index = 0
-        self._boost_bottom_button.set_color_index(relay_2_color_index)
 
-        ev_charging = self._get_zappi_charging()
+        ev_charging = GUIServer._get_zappi_charging(self._zappi_charge_watts)
         if ev_charging:
-            self._set_button.set_color_index(GUIServer.BUTTON_HIGH_INDEX)
+            set_button_color_index = GUIServer.BUTTON_HIGH_INDEX
         else:
             if self._zappi_charge_schedule_active:
-                self._set_button.set_color_index(GUIServer.BUTTON_MID_INDEX)
+                set_button_color_index = GUIServer.BUTTON_MID_INDEX
             else:
-                self._set_button.set_color_index(GUIServer.BUTTON_LOW_INDEX)
-
-        now = datetime.now()
+                set_button_color_index = GUIServer.BUTTON_LOW_INDEX
+
+        # Only push button color changes to the browser when the color actually
+        # changed, otherwise the 10 Hz timer sends a stream of no-op updates.
+        last_color_idx = self._last_color_idx
+        if relay_1_color_index != last_color_idx[0]:
+            self._boost_top_button.set_color_index(relay_1_color_index)
+            last_color_idx[0] = relay_1_color_index
+        if relay_2_color_index != last_color_idx[1]:
+            self._boost_bottom_button.set_color_index(relay_2_color_index)
+            last_color_idx[1] = relay_2_color_index
+        if set_button_color_index != last_color_idx[2]:
+            self._set_button.set_color_index(set_button_color_index)
+            last_color_idx[2] = set_button_color_index
+
+        # The clear schedule times are cached epoch floats, so the checks below are
+        # plain float compares rather than datetime object comparisons.
+        now = time()
         clear_eddi_boost_schedule_time = self._get_clear_eddi_boost_schedule_time()
         if clear_eddi_boost_schedule_time and clear_eddi_boost_schedule_time <= now:
             self.clear_eddi_boost_schedule_time()
@@ -1096,119 +1526,172 @@ class GUIServer(object):
         clear_zappi_schedule_time = self._get_clear_zappi_schedule_time()
         if clear_zappi_schedule_time and clear_zappi_schedule_time <= now:
             # Set the arg to report the zappi charge KWH
-            threading.Thread(target=self._clear_zappi_charge_schedules_thread, args=(True,)).start()
-            self._cfg_mgr.addAttr(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, "")
-            # Save the time that the zappi schedule should be deleted
-            self._save_config(show_info=False)
+            self._run_in_background(self._clear_zappi_charge_schedules_thread, True)
+            self._set_cfg(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, "")
+            # Save the time that the zappi schedule should be deleted. The save may
+            # perform network access checks so it must not run in this GUI timer
+            # callback. The FIFO worker queue runs it after the schedule clear above.
+            self._run_in_background(self._save_config, False)
             # Reset this so that the Set button returns to it's original color.
             self._zappi_charge_schedule_active = False
 
     def _get_clear_eddi_boost_schedule_time(self):
         """@brief Get the time to clear the eddi boost schedule. If a schedule has been set
                   then it is cleared when the tank heating has completed.
-           @return A datetime instance or None if not defined."""
+           @return The time as epoch seconds (a float) or None if not defined."""
+
+        value = self._get_cfg(GUIServer.CLEAR_EDDI_SCHEDULE_TIME)
+        # The time is now stored as integer epoch seconds so no parsing is needed.
+        if isinstance(value, (int, float)):
+            return float(value)
 
-        clear_datetime = None
+        # Config files written by earlier versions hold an ISO time string.
+        # Only re-parse if the config value has changed since the last call.
+        if value == self._clear_eddi_dt_cache[0]:
+            return self._clear_eddi_dt_cache[1]
+
+        clear_time = None
         try:
-            datetime_str = self._cfg_mgr.getAttr(GUIServer.CLEAR_EDDI_SCHEDULE_TIME)
-            clear_datetime = datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%SZ")
+            # fromisoformat parses the ISO form in C and is much faster than strptime.
+            # The trailing 'Z' is normalized first as Python 3.10 (the minimum
+            # supported version) rejects it. The stored value is local time so the
+            # tzinfo is dropped before conversion to epoch seconds.
+            clear_time = datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None).timestamp()
             self._debug("_get_clear_eddi_boost_schedule_time()")
         except ValueError:
             pass
-        return clear_datetime
+        self._clear_eddi_dt_cache = (value, clear_time)
+        return clear_time
 
     def _get_clear_zappi_schedule_time(self):
         """@brief Get the time to clear the zappi schedule. If a schedule has been set
                   then it is cleared when the charge has been completed or when the
                   clear schedule button is selected.
-           @return A datetime instance or None if not defined."""
-        clear_datetime = None
+           @return The time as epoch seconds (a float) or None if not defined."""
+        value = self._get_cfg(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME)
+        # The time is now stored as integer epoch seconds so no parsing is needed.
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        # Config files written by earlier versions hold an ISO time string.
+        # Only re-parse if the config value has changed since the last call.
+        if value == self._clear_zappi_dt_cache[0]:
+            return self._clear_zappi_dt_cache[1]
+
+        clear_time = None
         try:
-            datetime_str = self._cfg_mgr.getAttr(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME)
-            clear_datetime = datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%SZ")
+            # The trailing 'Z' is normalized as Python 3.10 rejects it (see
+            # _get_clear_eddi_boost_schedule_time()).
+            clear_time = datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None).timestamp()
         except ValueError:
             pass
-        return clear_datetime
+        self._clear_zappi_dt_cache = (value, clear_time)
+        return clear_time
 
     def clear_eddi_boost_schedule_time(self):
         """@brief Set the clear eddi boost schedule time."""
-        threading.Thread(target=self._clear_eddi_boost_schedule_time_thread).start()
+        self._run_in_background(self._clear_eddi_boost_schedule_time_thread)
 
     def _clear_eddi_boost_schedule_time_thread(self):
         """@brief Set the clear zappi charge schedule time."""
-        self._cfg_mgr.addAttr(GUIServer.CLEAR_EDDI_SCHEDULE_TIME, "")
+        self._set_cfg(GUIServer.CLEAR_EDDI_SCHEDULE_TIME, "")
         # Save the time that the zappi schedule should be deleted
         self._save_config(show_info=False)
-        # Call the method invoked when the user selects the eddi off button
-        threading.Thread(target=self._set_boost, args=(False, None, None)).start()
+        # Call the method invoked when the user selects the eddi off button.
+        # As the worker queue is FIFO this is guaranteed to run after the config save.
+        self._run_in_background(self._set_boost, False, None, None)
 
     def _clear_zappi_schedule_time_thread(self):
         """@brief Set the clear zappi charge schedule time."""
-        self._cfg_mgr.addAttr(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, "")
+        self._set_cfg(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, "")
         # Save the time that the zappi schedule should be deleted
         self._save_config(show_info=False)
         # Reset this so that the Set button returns to it's original color.
         self._zappi_charge_schedule_active = False
         # Call the method invoked when the user selects the Clear zappi schedules button
         # to remove the schedules from the zappi.
-        threading.Thread(target=self._clear_zappi_charge_schedules_thread).start()
+        self._run_in_background(self._clear_zappi_charge_schedules_thread)
 
     def _process_rx_dict(self, rxDict):
-        """@brief Process the dicts received from the GUI message queue.
+        """@brief Process the dicts received from the GUI message queue. Each message
+                  carries one payload key which is dispatched through the handler table
+                  built in __init__ rather than an elif chain.
            @param rxDict The dict received from the GUI message queue."""
+        msg_handlers = self._msg_handlers
+        for key, value in rxDict.items():
+            handler = msg_handlers.get(key)
+            if handler:
+                handler(value)
+
+    def _on_boost_1_on(self, _):
+        """@brief Handle a top tank boost on message."""
+        ui.notify(f'Set top tank heater boost on for {self._bootMinsSlider.value} mins.')
+
+    def _on_boost_2_on(self, _):
+        """@brief Handle a bottom tank boost on message."""
+        ui.notify(f'Set bottom tank heater boost on for {self._bootMinsSlider.value} mins.')
+
+    def _on_boost_off(self, _):
+        """@brief Handle a boost off message."""
+        ui.notify('Set top and bottom tank heaters off.')
+
+    def _on_error_message(self, error_message):
+        """@brief Handle an error message.
+           @param error_message The error message text."""
+        self._clear_zappi_button.enable()
+        ui.notify(f"{error_message}", type='negative')
+        if error_message.startswith("-5 status code returned from myenergi server"):
+            ui.notify("The myenergi system may still processing the previous command. Wait some time before trying again.")
+
+    def _on_info_message(self, info_message):
+        """@brief Handle an info message.
+           @param info_message The info message text."""
+        ui.notify(info_message)
+        # If we have confirmation from myenergi that the charge schedule was applied
+        if info_message == GUIServer.SET_ZAPPI_CHARGE_SCHEDULE_MESSAGE:
+            ui.notify("Wait a few mins before selecting the Get button to check the schedule is set on your ZAPPI.", type='warning', timeout=5000)
+            self._set_zappi_charge_active(True)
+        # If we have confirmation from myenergi that all charge schedules were removed
+        if info_message == GUIServer.CLEARED_ALL_CHARGING_SCHEDULES:
+            self._set_zappi_charge_active(False)
+            self._clear_zappi_button.enable()
 
-        if GUIServer.BOOST_1_ON in rxDict:
-            ui.notify(f'Set top tank heater boost on for {self._bootMinsSlider.value} mins.')
-
-        elif GUIServer.BOOST_2_ON in rxDict:
-            ui.notify(f'Set bottom tank heater boost on for {self._bootMinsSlider.value} mins.')
+    def _on_stats_update(self, stats_tuple):
+        """@brief Handle a stats update message carrying all values from one stats
+                  read so the GUI is updated in a single pass.
+           @param stats_tuple A (top temp, bottom temp, heater watts, zappi watts,
+                              heater relay number) tuple."""
+        top_tank_temp, bottom_tank_temp, heater_load_watts, zappi_charge_watts, relay_on = stats_tuple
+        self._topTankTempLabel.text = top_tank_temp
+        self._bottomTankTempLabel.text = bottom_tank_temp
+        self._heater_load_watts = heater_load_watts
+        self._zappi_charge_watts = zappi_charge_watts
+        self._relay_on = relay_on
+
+    def _on_zappi_charge_schedule(self, zappi_charge_table):
+        """@brief Handle a zappi charge schedule message.
+           @param zappi_charge_table The zappi charge schedule table."""
+        self._display_zappi_charge_table(zappi_charge_table)
+
+    def _on_plot_optimal_charge_times(self, argList):
+        """@brief Handle a plot optimal charge times message.
+           @param argList The plot argument list."""
+        self._plot_optimal_charge_times(argList)
+
+    def _on_clear_plot(self, _):
+        """@brief Handle a clear plot message."""
+        if self._plot_container:
+            self._plot_container.clear()
 
-        elif GUIServer.BOOST_OFF in rxDict:
-            ui.notify('Set top and bottom tank heaters off.')
+    def _on_zappi_charge_complete(self, charge_complete_msg):
+        """@brief Handle a zappi charge complete message.
+           @param charge_complete_msg The charge complete message text."""
+        self._persistent_notify(charge_complete_msg)
 
-        elif GUIServer.ERROR_MESSAGE in rxDict:
-            error_message = rxDict[GUIServer.ERROR_MESSAGE]
-            self._clear_zappi_button.enable()
-            ui.notify(f"{error_message}", type='negative')
-            if error_message.startswith("-5 status code returned from myenergi server"):
-                ui.notify("The myenergi system may still processing the previous command. Wait some time before trying again.")
-
-        elif GUIServer.INFO_MESSAGE in rxDict:
-            info_message = rxDict[GUIServer.INFO_MESSAGE]
-            ui.notify(info_message)
-            # If we have confirmation from myenergi that the charge schedule was applied
-            if info_message == GUIServer.SET_ZAPPI_CHARGE_SCHEDULE_MESSAGE:
-                ui.notify("Wait a few mins before selecting the Get button to check the schedule is set on your ZAPPI.", type='warning', timeout=5000)
-                self._set_zappi_charge_active(True)
-            # If we have confirmation from myenergi that all charge schedules were removed
-            if info_message == GUIServer.CLEARED_ALL_CHARGING_SCHEDULES:
-                self._set_zappi_charge_active(False)
-                self._clear_zappi_button.enable()
-
-        elif GUIServer.TANK_TEMPERATURES in rxDict:
-            top_tank_temp, bottom_tank_temp = rxDict[GUIServer.TANK_TEMPERATURES]
-            self._topTankTempLabel.text = top_tank_temp
-            self._bottomTankTempLabel.text = bottom_tank_temp
-
-        elif GUIServer.ZAPPI_CHARGE_SCHEDULE in rxDict:
-            zappi_charge_table = rxDict[GUIServer.ZAPPI_CHARGE_SCHEDULE]
-            self._display_zappi_charge_table(zappi_charge_table)
-
-        elif GUIServer.PLOT_OPTIMAL_CHARGE_TIMES in rxDict:
-            argList = rxDict[GUIServer.PLOT_OPTIMAL_CHARGE_TIMES]
-            self._plot_optimal_charge_times(argList)
-
-        elif GUIServer.CLEAR_PLOT in rxDict:
-            if self._plot_container:
-                self._plot_container.clear()
-
-        elif GUIServer.ZAPPI_CHARGE_COMPLETE_MESSAGE in rxDict:
-            charge_complete_msg = rxDict[GUIServer.ZAPPI_CHARGE_COMPLETE_MESSAGE]
-            self._persistent_notify(charge_complete_msg)
-
-        elif GUIServer.WARNING_MESSAGE in rxDict:
-            warning_message = rxDict[GUIServer.WARNING_MESSAGE]
-            ui.notify(warning_message, type="warning")
+    def _on_warning_message(self, warning_message):
+        """@brief Handle a warning message.
+           @param warning_message The warning message text."""
+        ui.notify(warning_message, type="warning")
 
     def _persistent_notify(self, message: str):
         with ui.dialog() as dialog, ui.card():
@@ -1258,11 +1741,14 @@ class GUIServer(object):
     def _update_boost_time(self):
         """@brief Called to update the boost until time."""
         dt = datetime.now().astimezone()
-        dt = dt + timedelta(minutes=self._bootMinsSlider.value)
-        mins_to_add = 15 - (dt.minute % 15)
-        dt = dt + timedelta(minutes=mins_to_add)
+        # Integer timestamp arithmetic is cheaper than repeated timedelta adds and
+        # datetime.replace(). Round up to the next quarter hour boundary (a time
+        # already on a boundary moves to the next one, as before).
+        ts = int(dt.timestamp()) + int(self._bootMinsSlider.value) * 60
+        ts = (ts // 900 + 1) * 900
+        dt = datetime.fromtimestamp(ts, tz=dt.tzinfo)
         self._boost_time_value = f"{dt.hour:02d}:{dt.minute:02d}"
-        self._boost_until_datetime = dt.replace(second=0, microsecond=0)
+        self._boost_until_datetime = dt
 
     def _enable_buttons(self, enabled):
         for _button in self._buttonList:
@@ -1277,7 +1763,7 @@ class GUIServer(object):
         self._eddi_heater_button_selected = 1
         self._enable_buttons(True)
         ui.notify("Setting top boost on.", position='center')
-        threading.Thread(target=self._set_boost, args=(True, MyEnergi.TANK_TOP, self._boost_until_datetime)).start()
+        self._run_in_background(self._set_boost, True, MyEnergi.TANK_TOP, self._boost_until_datetime)
         self._reset_polling_rate()
 
     def _bottom_boost(self):
@@ -1286,7 +1772,7 @@ class GUIServer(object):
         self._eddi_heater_button_selected = 2
         self._enable_buttons(True)
         ui.notify("Setting bottom boost on.", position='center')
-        threading.Thread(target=self._set_boost, args=(True, MyEnergi.TANK_BOTTOM, self._boost_until_datetime)).start()
+        self._run_in_background(self._set_boost, True, MyEnergi.TANK_BOTTOM, self._boost_until_datetime)
         self._reset_polling_rate()
 
     def _stop_boost(self):
@@ -1295,7 +1781,7 @@ class GUIServer(object):
         self._eddi_heater_button_selected = 0
         self._enable_buttons(True)
         ui.notify("Turning off boost.", position='center')
-        threading.Thread(target=self._set_boost, args=(False, None, None)).start()
+        self._run_in_background(self._set_boost, False, None, None)
         self._reset_polling_rate()
         self.clear_eddi_boost_schedule_time()
 
@@ -1308,11 +1794,11 @@ class GUIServer(object):
 
     def _previous_quarter_hour(self, dt):
         """@brief Get a datetime instance that is aligned with the a quarter hour starting just before the current one."""
-        # Subtract the number of mins
-        spare_mins = dt.minute % 15
-        new_minute = dt.minute - spare_mins
-        rounded_time = dt.replace(minute=new_minute, second=0, microsecond=0)
-        return rounded_time
+        # Round down to the previous quarter hour using integer timestamp arithmetic,
+        # which is cheaper than datetime.replace().
+        ts = int(dt.timestamp())
+        ts -= ts % 900
+        return datetime.fromtimestamp(ts, tz=dt.tzinfo)
 
     def _set_boost(self, on, relay, on_until_time):
         """@brief Called in a separate thread to talk to the eddi unit and set the hot water boost state.
@@ -1360,7 +1846,9 @@ class GUIServer(object):
             # as I've seen the myenergi system take up to 5 minutes to delete a schedule after sending a
             # successfull command. We want to have it clear before then next 15 minute slot.
             clear_schedule_time = on_until_time + timedelta(minutes=10)
-            self._cfg_mgr.addAttr(GUIServer.CLEAR_EDDI_SCHEDULE_TIME, clear_schedule_time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            # Stored as integer epoch seconds, which avoids the strftime/parse round
+            # trip and is smaller in the config file.
+            self._set_cfg(GUIServer.CLEAR_EDDI_SCHEDULE_TIME, int(clear_schedule_time.timestamp()))
             self._debug(GUIServer.CLEAR_EDDI_SCHEDULE_TIME + f"={clear_schedule_time}")
 
         else:
@@ -1370,37 +1858,57 @@ class GUIServer(object):
             self._update_gui(msg_dict)
 
     def _is_eddi_config_entered(self):
-        """@return True if the eddi config has been entered."""
-        eddi_config_set = False
-        api_key = self._cfg_mgr.getAttr(GUIServer.MYENERGI_API_KEY)
-        eddi_serial_number = self._cfg_mgr.getAttr(GUIServer.EDDI_SERIAL_NUMBER)
-        if api_key and \
-           len(api_key) > 0 and \
-           eddi_serial_number and \
-           len(eddi_serial_number) > 0:
-            eddi_config_set = True
-        return eddi_config_set
+        """@return True if the eddi config has been entered. This is a cached boolean,
+                  recomputed when the myenergi interface is (re)created, as the check
+                  sits on the periodic stats read path."""
+        return self._eddi_config_ok
+
+    def _run_update_stats(self):
+        """@brief Run a stats read and release the gate semaphore when it completes,
+                  successfully or not, so the next read can be submitted."""
+        try:
+            self._update_stats()
+        finally:
+            self._stats_sem.release()
 
     def _update_stats(self):
         """@brief Update the stats read from the network.
                   This should not be called in the GUI thread as it will block if there are network issues."""
         try:
             if self._is_eddi_config_entered():
-                self._my_energi.update_stats()
+                # No explicit update_stats() call: the getters below share one fetch
+                # through the MyEnergi TTL cache, so refresh bursts triggered inside
+                # the cache window reuse the in-memory stats without a round trip.
                 top_temp = self._my_energi.get_eddi_top_tank_temp()
                 bottom_temp = self._my_energi.get_eddi_bottom_tank_temp()
-                self._heater_load_watts = self._my_energi.get_eddi_heater_watts()
+                heater_load_watts = self._my_energi.get_eddi_heater_watts()
+                zappi_charge_watts = self._zappi_charge_watts
                 try:
-                    self._zappi_charge_watts = self._my_energi.get_zappi_charge_watts()
+                    zappi_charge_watts = self._my_energi.get_zappi_charge_watts()
                 except Exception:
-                    zappi_serial_number = self._cfg_mgr.getAttr(GUIServer.ZAPPI_SERIAL_NUMBER)
+                    zappi_serial_number = self._get_cfg(GUIServer.ZAPPI_SERIAL_NUMBER)
                     # If the zappi serial number has been set raise an errror to show to the user as
                     # we shopuld be able to communicate with the zappi charger.
                     if len(zappi_serial_number) > 0:
                         raise
-                self._relay_on = self._my_energi.get_eddi_heater_number()
+                relay_on = self._my_energi.get_eddi_heater_number()
+
+                # Adaptive polling: if anything changed since the last read then
+                # return to the fast poll rate, otherwise leave the existing ramp
+                # backing off towards the max read delay.
+                stats_tuple = (top_temp,
+                               bottom_temp,
+                               heater_load_watts,
+                               zappi_charge_watts,
+                               relay_on)
+                if stats_tuple != self._last_stats_tuple:
+                    self._last_stats_tuple = stats_tuple
+                    self._init_stats_read_delay = True
+
+                # All fresh values travel in one message so the GUI thread applies
+                # them in a single pass rather than via several queue hand-offs.
                 msg_dict = {}
-                msg_dict[GUIServer.TANK_TEMPERATURES] = [top_temp, bottom_temp]
+                msg_dict[GUIServer.STATS_UPDATE] = stats_tuple
                 self._update_gui(msg_dict)
         except Exception as ex:
             GUIServer.Print_Exception()
@@ -1423,7 +1931,7 @@ class GUIServer(object):
                                                     label='Zappi charge rate')
 
         with ui.row():
-            kwh = self._cfg_mgr.getAttr(GUIServer.EV_BATTERY_KWH)
+            kwh = self._get_cfg(GUIServer.EV_BATTERY_KWH)
             self._ev_kwh = ui.number(label='EV Battery (kWh)', value=kwh, format='%.1f')
 
         with ui.row():
@@ -1433,7 +1941,8 @@ class GUIServer(object):
                                                       label='Electricity region code')
 
         with ui.row():
-            self._tariff_radio = ui.radio(GUIServer.TARIFF_LIST,
+            # ui.radio expects a list or dict of options so the tuple is converted here.
+            self._tariff_radio = ui.radio(list(GUIServer.TARIFF_LIST),
                                           on_change=self._tariff_changed,
                                           value=GUIServer.TARIFF_LIST[0])
 
@@ -1452,21 +1961,24 @@ class GUIServer(object):
         with ui.row():
             self._config_save_button = ui.button('Save', color=GUIServer.DEFAULT_BUTTON_COLOR, on_click=self._save_config_button_selected)
 
-        self._api_key.value = self._cfg_mgr.getAttr(GUIServer.MYENERGI_API_KEY)
-        self._eddi_serial_number.value = self._cfg_mgr.getAttr(GUIServer.EDDI_SERIAL_NUMBER)
-        self._zappi_serial_number.value = self._cfg_mgr.getAttr(GUIServer.ZAPPI_SERIAL_NUMBER)
-        self._zappi_max_charge_rate.value = self._cfg_mgr.getAttr(GUIServer.ZAPPI_MAX_CHARGE_RATE)
-        self._electricity_region_code.value = self._cfg_mgr.getAttr(GUIServer.ELECTRICITY_REGION_CODE)
-        self._octopus_agile_tariff = self._cfg_mgr.getAttr(GUIServer.OCTOPUS_AGILE_TARIFF)
+        self._api_key.value = self._get_cfg(GUIServer.MYENERGI_API_KEY)
+        self._eddi_serial_number.value = self._get_cfg(GUIServer.EDDI_SERIAL_NUMBER)
+        self._zappi_serial_number.value = self._get_cfg(GUIServer.ZAPPI_SERIAL_NUMBER)
+        self._zappi_max_charge_rate.value = self._get_cfg(GUIServer.ZAPPI_MAX_CHARGE_RATE)
+        self._electricity_region_code.value = self._get_cfg(GUIServer.ELECTRICITY_REGION_CODE)
+        self._octopus_agile_tariff = self._get_cfg(GUIServer.OCTOPUS_AGILE_TARIFF)
         self._set_octopus_agile_tariff(self._octopus_agile_tariff)
         self._enable_octopus_agile_tariff(self._octopus_agile_tariff)
-        self._undershoot_checkbox.value = self._cfg_mgr.getAttr(GUIServer.UNDERSHOOT_CHARGE)
+        self._undershoot_checkbox.value = self._get_cfg(GUIServer.UNDERSHOOT_CHARGE)
 
     def _save_config_button_selected(self):
-        """@brief Called when the save button is selected by the user in the Setting tab."""
-        self._save_config()
+        """@brief Called when the save button is selected by the user in the Setting tab.
+                  The save involves network and disk I/O so it's pushed to the background
+                  worker queue to keep the GUI responsive. The queue is FIFO so the
+                  myenergi interface is recreated after the config has been saved."""
+        self._run_in_background(self._save_config)
         # Create a new instance of the interface to talk to the myenergi products
-        self._create_myenergi()
+        self._run_in_background(self._create_myenergi)
 
     def _set_octopus_agile_tariff(self, enabled):
         """@brief Set the radio buttons to enable the octopus agile tariff or the other (manually entered) tariff."""
@@ -1487,16 +1999,16 @@ class GUIServer(object):
     def _tariff_changed(self):
         """@brief Called when the tariff radio button is selected."""
         octopus_agile_tariff = self._is_octopus_agile_tariff_enabled()
+        # _enable_octopus_agile_tariff() handles the button state so only the
+        # plot side effects are needed here.
         self._enable_octopus_agile_tariff(octopus_agile_tariff)
         if octopus_agile_tariff:
-            self._add_tariff_value_button.disable()
-            self._clear_tariff_value_button.disable()
             if self._other_tariff_plot_container:
                 self._other_tariff_plot_container.clear()
+                # The container is now empty so the next plot must render.
+                self._last_plot_key = (None, None)
 
         else:
-            self._add_tariff_value_button.enable()
-            self._clear_tariff_value_button.enable()
             # We only display the other tarrif plot as the agile tariff will change
             self._plot_tariff()
 
@@ -1532,23 +2044,25 @@ class GUIServer(object):
         duration = self._add_free_elect_period_dialog.getValue(GUIServer.ZERO_COST_ELEC_DURATION)
         self._calc_optimal_charge_times(free_start_time=start_time, free_duration=duration)
 
+    @staticmethod
+    def _parse_hh_mm(text):
+        """@brief Parse a HH:MM string with a single precompiled regex match.
+           @param text The text in HH:MM format.
+           @return An (hour, min) tuple or None if the text is not valid."""
+        match = _HHMM_RE.match(text) if text else None
+        if match:
+            return (int(match[1]), int(match[2]))
+        return None
+
     def _get_hour_min(self, tstr):
         """@brief Get the hour and min from a single tariff point.
            @return A tuple containing
                    0 = hour
                    1 = min"""
-        hour = -1
-        min = -1
-        elems = tstr.split(':')
-        if len(elems) == 2:
-            try:
-                hour = int(elems[0])
-                min = int(elems[1])
-            except ValueError:
-                pass
-        if hour == -1 or min == -1:
+        hour_min = GUIServer._parse_hh_mm(tstr)
+        if hour_min is None:
             raise Exception(f"{tstr} is invalid (HH:MM expected).")
-        return (hour, min)
+        return hour_min
 
     def _tariff_value_entered(self):
         start_time = self._add_tariff_dialog.getValue(GUIServer.ADD_TARIFF_START_TIME)
@@ -1577,6 +2091,7 @@ class GUIServer(object):
                 tariff_point = (start_time, price)
                 # PJA Add checks for duplicate start times
                 self._other_tariff_values.append(tariff_point)
+                self._tariff_ver += 1
                 self._plot_tariff()
 
         except Exception as ex:
@@ -1585,90 +2100,113 @@ class GUIServer(object):
 
     def _get_tariff(self):
         """@brief get a list of the tariff string values converted to datetime instances.
+                  The result is a deterministic transform of self._other_tariff_values so
+                  it is cached and only rebuilt when the tariff values change (the
+                  version is bumped when a tariff point is added or the tariff cleared).
            @return tariff_datetime_list A list. Each element has two elements.
                    0: A datetime instance at incrementing times during the day.
                    1: The price of the electricity at that point in the day."""
         if len(self._other_tariff_values) == 0:
             raise Exception("Use the add button in the settings tab to set the tariff values through the day.")
 
-        # Convert the tariff times into datetime instances
+        if self._tariff_cache is not None and self._tariff_cache_ver == self._tariff_ver:
+            return self._tariff_cache
+
+        # Convert the tariff times into datetime instances. The date/timezone part
+        # is identical for every entry so it is computed once outside the loop.
+        base_dt = datetime.now().astimezone().replace(second=0, microsecond=0)
         tariff_list = []
-        index = 0
+        seen_minutes = set()
         for other_tariff_value in self._other_tariff_values:
             hour, min = self._get_hour_min(other_tariff_value[0])
             price = other_tariff_value[1]
-            dt = datetime.now().astimezone()
-            dt = dt.replace(minute=min, hour=hour, second=0, microsecond=0)
-            # Check the datetime is not in the list twice
-            if dt in tariff_list:
+            dt = base_dt.replace(minute=min, hour=hour)
+            # Check the time is not in the list twice
+            minute_of_day = hour * 60 + min
+            if minute_of_day in seen_minutes:
                 raise Exception(f"{hour:02d}:{min:02d} is in the tariff list twice.")
-
-            tariff_list.append((deepcopy(dt), price))
-            index = index + 1
+            seen_minutes.add(minute_of_day)
+
+            # datetime instances are immutable so the reference is stored directly.
+            tariff_list.append((dt, price))
+        self._tariff_cache = tariff_list
+        self._tariff_cache_ver = self._tariff_ver
+        # Parallel minute-of-day / price arrays so _get_price can binary search
+        # rather than scan the list.
+        self._tariff_minutes = [t[0].hour * 60 + t[0].minute for t in tariff_list]
+        self._tariff_prices = [t[1] for t in tariff_list]
         return tariff_list
 
-    def _get_price(self, _datetime):
+    def _get_price(self, _datetime, tariff_data=None):
         """@brief Get the price of the electricity at the given time.
            @param _datetime The datetime of interest.
+           @param tariff_data An optional precomputed tariff list from _get_tariff() so
+                              callers sampling many times avoid repeated lookups.
            @return The price of electricity per kWh at the given time of day or None if no tariff data is available."""
-        tariff_data = self._get_tariff()
-        if tariff_data and len(tariff_data) > 0:
-            price = tariff_data[0][1]
-            for data in tariff_data:
-                dt = data[0]
-
-                if _datetime.hour < dt.hour:
-                    break
-                elif _datetime.hour == dt.hour and _datetime.minute < dt.minute:
-                    break
-
-                price = data[1]
+        if tariff_data is None:
+            # Ensures the minute/price arrays below are up to date.
+            self._get_tariff()
+        # The price is piecewise constant in time of day so lookups are memoized
+        # per minute of day. The memo is dropped when the tariff changes.
+        if self._price_memo_ver != self._tariff_ver:
+            self._price_memo.clear()
+            self._price_memo_ver = self._tariff_ver
+        minute_of_day = _datetime.hour * 60 + _datetime.minute
+        price = self._price_memo.get(minute_of_day)
+        if price is None:
+            # Binary search for the active tariff segment. Times before the first
+            # segment take the first segment's price, as before.
+            index = bisect_right(self._tariff_minutes, minute_of_day) - 1
+            if index < 0:
+                index = 0
+            price = self._tariff_prices[index]
+            self._price_memo[minute_of_day] = price
         return price
 
     def _plot_tariff(self):
         """@brief Plot the available tariff data."""
         try:
-            ui.notify("Plotting the tariff data.", position='center', type='ongoing', timeout=2000)
             now = datetime.now().astimezone()
-            start_of_this_day = now.replace(minute=0, hour=0, second=0)
-            # Get a value for every 1/2 hour through the day
-            time_intervals = [start_of_this_day + timedelta(minutes=30 * i) for i in range((24*2))]
+            # If the tariff has not changed since it was last plotted today then the
+            # figure in the container is already correct.
+            if self._last_plot_key == (self._tariff_ver, now.date()):
+                return
+            ui.notify("Plotting the tariff data.", position='center', type='ongoing', timeout=2000)
+            # Get a value for every 1/2 hour through the day. The list is identical
+            # within a calendar day so it is cached keyed on today's date.
+            today = now.date()
+            if self._plot_intervals_cache[0] == today:
+                time_intervals = self._plot_intervals_cache[1]
+            else:
+                start_of_this_day = now.replace(minute=0, hour=0, second=0)
+                time_intervals = [start_of_this_day + timedelta(minutes=30 * i) for i in range((24*2))]
+                self._plot_intervals_cache = (today, time_intervals)
+            # Build the tariff data once rather than once per sampled interval.
+            tariff_data = self._get_tariff()
             price_list = []
+            # Track the max price as we build the list rather than a second pass.
+            max_cost = None
             for time_interval in time_intervals:
-                price = self._get_price(time_interval)
+                price = self._get_price(time_interval, tariff_data)
+                if max_cost is None or price > max_cost:
+                    max_cost = price
                 price_list.append(price)
 
             prices = price_list
 
             fig = go.Figure()
-            max_cost = max(prices)
-            fig.update_layout(margin=dict(l=0, r=0, t=0, b=0),
-                              width=350,
-                              height=150,
-                              showlegend=False,
-                              plot_bgcolor="black",       # Background for the plot area
-                              paper_bgcolor="black",      # Background for the entire figure
-                              font=dict(color="yellow"),  # Font color for labels and title
-                              xaxis=dict(
-                                  title='Day (HH:MM)',
-                                  tickformat='%H:%M',     # Format as hours:minutes
-                                  color="yellow",         # Axis label color
-                                  gridcolor="gray",       # Gridline color
-                                  zerolinecolor="gray"    # Zero line color
-                              ),
-                              yaxis=dict(
-                                  title="£ per kWh",
-                                  color="yellow",         # Axis label color
-                                  gridcolor="gray",       # Gridline color
-                                  zerolinecolor="gray",   # Zero line color
-                                  range=[0, max_cost*1.5]
-                              ),)
+            # Only the y axis range changes between plots; the rest of the layout
+            # comes from the class-level base dict.
+            layout = dict(GUIServer._TARIFF_PLOT_LAYOUT)
+            layout['yaxis'] = dict(layout['yaxis'], range=[0, max_cost*1.5])
+            fig.update_layout(**layout)
             fig.add_trace(go.Bar(x=time_intervals, y=prices, marker=dict(color='green')))
             if self._other_tariff_plot_container:
                 self._other_tariff_plot_container.clear()
                 # Add the new plot to the container
                 with self._other_tariff_plot_container:
                     ui.plotly(fig)
+                self._last_plot_key = (self._tariff_ver, now.date())
 
         except Exception as ex:
             GUIServer.Print_Exception()
@@ -1677,24 +2215,39 @@ class GUIServer(object):
     def _clear_tariff(self):
         """@brief Clear the other tariff values."""
         self._other_tariff_values = []
+        self._tariff_ver += 1
         if self._other_tariff_plot_container:
             self._other_tariff_plot_container.clear()
 
+    def _get_check_myenergi(self):
+        """@brief Get the MyEnergi instance used for the settings tab access checks.
+                  The instance is created once and then has its credentials updated
+                  so the pooled HTTP connections survive consecutive checks.
+           @return A MyEnergi instance configured from the settings tab fields."""
+        if self._check_myenergi is None:
+            self._check_myenergi = MyEnergi(self._api_key.value)
+            self._check_myenergi.set_eddi_serial_number(self._eddi_serial_number.value)
+            self._check_myenergi.set_zappi_serial_number(self._zappi_serial_number.value)
+        else:
+            self._check_myenergi.update_credentials(self._api_key.value,
+                                                    self._eddi_serial_number.value,
+                                                    self._zappi_serial_number.value)
+        return self._check_myenergi
+
     def _check_eddi_access_ok(self, show_info=True):
         """@brief Check that the stats can be read from the myenergi eddi unit.
            @param show_info If True then show info messages.
            @return True if eddi access ok."""
         ok = False
         try:
-            myEnergi = MyEnergi(self._api_key.value)
-            myEnergi.set_eddi_serial_number(self._eddi_serial_number.value)
+            myEnergi = self._get_check_myenergi()
             myEnergi.get_eddi_stats()
             if show_info:
-                ui.notify("Successfully read eddi stats.", position='center')
+                self._update_gui({GUIServer.INFO_MESSAGE: "Successfully read eddi stats."})
             ok = True
         except Exception as ex:
             GUIServer.Print_Exception()
-            ui.notify(f"eddi: {str(ex)}", type='negative')
+            self._update_gui({GUIServer.ERROR_MESSAGE: f"eddi: {str(ex)}"})
         return ok
 
     def _check_zappi_access_ok(self, show_info=True):
@@ -1702,16 +2255,14 @@ class GUIServer(object):
            @return True if eddi access ok."""
         ok = False
         try:
-            myEnergi = MyEnergi(self._api_key.value)
-            myEnergi.set_eddi_serial_number(self._eddi_serial_number.value)
-            myEnergi.set_zappi_serial_number(self._zappi_serial_number.value)
+            myEnergi = self._get_check_myenergi()
             myEnergi.get_zappi_stats()
             if show_info:
-                ui.notify("Successfully read zappi stats.", position='center')
+                self._update_gui({GUIServer.INFO_MESSAGE: "Successfully read zappi stats."})
             ok = True
         except Exception as ex:
             GUIServer.Print_Exception()
-            ui.notify(f"zappi: {str(ex)}", type='negative')
+            self._update_gui({GUIServer.ERROR_MESSAGE: f"zappi: {str(ex)}"})
         return ok
 
     def _show_regional_codes(self):
@@ -1745,18 +2296,18 @@ class GUIServer(object):
             with ui.row().classes('w-full'):
                 ui.label('Target EV charge (%)')
                 self._target_ev_charge_input = ui.number(min=5, max=100, value=0).style(GUIServer.TEXT_STYLE_D_SIZE)
-            self._target_ev_charge_input.value = self._cfg_mgr.getAttr(GUIServer.TARGET_EV_CHARGE_PERCENTAGE)
+            self._target_ev_charge_input.value = self._get_cfg(GUIServer.TARGET_EV_CHARGE_PERCENTAGE)
 
         with ui.row().classes('w-full'):
             with ui.row().classes('w-full'):
                 ui.label('Current EV charge (%)')
                 self._current_ev_charge_input = ui.number(min=0, max=100, value=0).style(GUIServer.TEXT_STYLE_D_SIZE)
-            self._current_ev_charge_input.value = self._cfg_mgr.getAttr(GUIServer.CURRENT_EV_CHARGE_PERCENTAGE)
+            self._current_ev_charge_input.value = self._get_cfg(GUIServer.CURRENT_EV_CHARGE_PERCENTAGE)
 
         # Put this off the bottom of the mobile screen as most times it will not be needed
         # and there is not enough room on the mobile screen above the plot pane.
         self._end_charge_time_input = self._get_input_time_field('Ready by')
-        self._end_charge_time_input.value = self._cfg_mgr.getAttr(GUIServer.READY_BY)
+        self._end_charge_time_input.value = self._get_cfg(GUIServer.READY_BY)
 
         self._free_energy_checkbox = ui.checkbox('Free energy period')
 
@@ -1778,7 +2329,7 @@ class GUIServer(object):
     def _get_zappi_charge(self):
         """@brief Get the current zappi charge schedule."""
         ui.notify("Reading the zappi charge shedules.")
-        threading.Thread(target=self._get_zappi_charge_thread).start()
+        self._run_in_background(self._get_zappi_charge_thread)
 
     def _send_zappi_sched_to_gui(self, table_row_list):
         """@brief After having read the zappi schedule list from the myenergi system
@@ -1867,23 +2418,7 @@ class GUIServer(object):
                    1 = mins
 
                    o None if not valid."""
-        hours = None
-        mins = None
-        if text and len(text) >= 3:
-            elems = text.split(':')
-            if len(elems) == 2:
-                hours_str = elems[0]
-                mins_str = elems[1]
-                try:
-                    hours = int(hours_str)
-                    mins = int(mins_str)
-                except ValueError:
-                    pass
-
-        if hours is not None and mins is not None:
-            return (hours, mins)
-
-        return None
+        return GUIServer._parse_hh_mm(text)
 
     def _calc_optimal_charge_times(self, free_start_time="", free_duration=""):
         """@brief Calculate the optimal charge times."""
@@ -1947,12 +2482,13 @@ class GUIServer(object):
         else:
             region_code = self._get_region_code()
             ui.notify("Calculating optimal charge time/s.", position='center', type='ongoing', timeout=1000)
-            threading.Thread(target=self.calc_optimal_charge_times_thread, args=(region_code,
-                                                                                 charge_time_mins,
-                                                                                 float(self._zappi_max_charge_rate.value),
-                                                                                 self._get_end_charge_time(),
-                                                                                 free_start_time_hh_mm,
-                                                                                 free_duration_hh_mm)).start()
+            self._run_in_background(self.calc_optimal_charge_times_thread,
+                                    region_code,
+                                    charge_time_mins,
+                                    float(self._zappi_max_charge_rate.value),
+                                    self._get_end_charge_time(),
+                                    free_start_time_hh_mm,
+                                    free_duration_hh_mm)
 
     def _get_region_code(self):
         """@brief Get the electricity region code.
@@ -1971,18 +2507,10 @@ class GUIServer(object):
         # If the end charge time is defined then ensure we don't have time after this in the list.
         if end_charge_time:
             now = datetime.now().astimezone()
-            end_charge_time_today = now.replace(hour=end_charge_time[0], minute=end_charge_time[1], second=0, microsecond=0)
-            # If the user entered a time that is earlier today
-            if end_charge_time_today < now:
-                # Assume that the time entered is is tomorrow.
-                end_charge_time_tomorrow = end_charge_time_today + timedelta(days=1)
-                end_charge_datetime = end_charge_time_tomorrow
-            else:
-                now = datetime.now().astimezone()
-                # Add the HH:MM to the time
-                then = now + timedelta(hours=end_charge_time[0], minutes=end_charge_time[1])
-                then = then.replace(second=0, microsecond=0)
-                end_charge_datetime = then
+            end_charge_datetime = now.replace(hour=end_charge_time[0], minute=end_charge_time[1], second=0, microsecond=0)
+            # If the user entered a time that is earlier today assume that the time entered is tomorrow.
+            if end_charge_datetime < now:
+                end_charge_datetime += timedelta(days=1)
         return end_charge_datetime
 
     def _get_tariff_data(self, end_charge_time):
@@ -1996,17 +2524,14 @@ class GUIServer(object):
         # If the end charge time is defined then ensure we don't have time after this in the list.
         if end_charge_time:
             then = GUIServer.GET_END_CHARGE_DATETIME(end_charge_time)
+            # The intervals ascend so a binary search finds the cutoff index.
+            time_intervals = time_intervals[:bisect_right(time_intervals, then)]
 
-            tmp_time_intervals = []
-            for time_interval in time_intervals:
-                if then < time_interval:
-                    break
-                tmp_time_intervals.append(time_interval)
-            time_intervals = tmp_time_intervals
-
+        # Build the tariff data once rather than once per sampled interval.
+        tariff_data = self._get_tariff()
         price_list = []
         for time_interval in time_intervals:
-            price = self._get_price(time_interval)
+            price = self._get_price(time_interval, tariff_data)
             price_list.append(price)
 
         return (time_intervals, price_list)
@@ -2023,25 +2548,27 @@ class GUIServer(object):
            @param plot_cost_list A list of the tariff costs."""
 
         # If the user has entered a period of time when they will get free energy
-        if free_start_time_hh_mm and free_duration_hh_mm:
-            # Update the tariff values with the zero cost energy times.
-            free_start_time = None
-            free_stop_time = None
-            for index in range(0, len(plot_time_stamp_list)):
-                ts = plot_time_stamp_list[index]
-                if ts.hour == free_start_time_hh_mm[0]:
-                    # We assume that the HH:MM entered by the user is the next HH:MM that come round.
-                    free_start_time = plot_time_stamp_list[index].replace(hour=free_start_time_hh_mm[0], minute=free_start_time_hh_mm[1], second=0, microsecond=0)
-                    free_stop_time = free_start_time + timedelta(hours=free_duration_hh_mm[0], minutes=free_duration_hh_mm[1])
-                    break
-
-            # If we have a free energy period
-            if free_start_time and free_stop_time:
-                # Set the cost of energy in this period to 0
-                for index in range(0, len(plot_time_stamp_list)):
-                    ts = plot_time_stamp_list[index]
-                    if ts >= free_start_time and ts <= free_stop_time:
-                        plot_cost_list[index] = 0.0
+        if free_start_time_hh_mm and free_duration_hh_mm and plot_time_stamp_list:
+            # The timestamps are a fixed 30 minute grid so rather than scanning the
+            # list the affected indexes can be computed directly.
+            base = plot_time_stamp_list[0]
+            # We assume that the HH:MM entered by the user is the next HH:MM that come round.
+            free_start_time = base.replace(hour=free_start_time_hh_mm[0], minute=free_start_time_hh_mm[1], second=0, microsecond=0)
+            if free_start_time_hh_mm[0] < base.hour:
+                free_start_time += timedelta(days=1)
+            free_stop_time = free_start_time + timedelta(hours=free_duration_hh_mm[0], minutes=free_duration_hh_mm[1])
+
+            # The first index at or after the free period start and the last index at
+            # or before the free period stop, clamped to the list bounds.
+            start_index = ceil((free_start_time - base).total_seconds() / 1800.0)
+            stop_index = int((free_stop_time - base).total_seconds() // 1800)
+            if start_index < 0:
+                start_index = 0
+            if stop_index >= len(plot_cost_list):
+                stop_index = len(plot_cost_list) - 1
+            # Set the cost of energy in this period to 0
+            if stop_index >= start_index:
+                plot_cost_list[start_index:stop_index + 1] = [0.0] * (stop_index + 1 - start_index)
 
     def _get_charge_details(self,
                             charge_mins,
@@ -2094,11 +2621,10 @@ class GUIServer(object):
             ect = end_charge_datetime.strftime("%H:%M on %d %B")
             raise Exception(f"Unable to charge for {charge_mins} minutes before {ect}")
 
-        # Determine the slot duration (30mins ?)
-        slot_start_t = plot_time_stamp_list[0]
-        slot_end_t = plot_time_stamp_list[1]
-        slot_duration = slot_end_t-slot_start_t
-        slot_duration_mins = slot_duration.total_seconds()/60.0
+        # Both tariff sources are hard wired to 30 minute slots so the duration is
+        # a constant rather than being derived from timestamp arithmetic.
+        slot_duration_mins = GUIServer.CHARGE_SLOT_MINS
+        slot_delta = timedelta(minutes=slot_duration_mins)
 
         # Update the slots with any free energy periods
         self._update_free_periods(free_start_time_hh_mm, free_duration_hh_mm, plot_time_stamp_list, plot_cost_list)
@@ -2106,52 +2632,52 @@ class GUIServer(object):
         time_stamp_list = plot_time_stamp_list
         cost_list = plot_cost_list
 
-        # Pair dates with costs and sort by cost
-        sorted_pairs = sorted(zip(cost_list, time_stamp_list))
+        # The greedy loop below only ever consumes the cheapest slots needed to
+        # cover the charge time, so pick just that many (plus one for a possible
+        # partial slot) rather than sorting every (cost, timestamp) pair.
+        slot_count = ceil(charge_mins / slot_duration_mins) + 1
+        sorted_pairs = nsmallest(slot_count, zip(cost_list, time_stamp_list))
 
-        # Unzip into separate sorted lists
-        sorted_costs, sorted_dates = zip(*sorted_pairs)
+        # Bind the slot key constants to locals outside the loop.
+        start_key = RegionalElectricity.SLOT_START_DATETIME
+        stop_key = RegionalElectricity.SLOT_STOP_DATETIME
+        cost_key = RegionalElectricity.SLOT_COST
 
-        # Convert to lists (optional)
-        sorted_costs = list(sorted_costs)
-        sorted_dates = list(sorted_dates)
+        # The energy delivered in a full slot is constant so compute it once.
+        kwh_per_slot = (slot_duration_mins/60.0)*charge_rate_kw
 
         cost = 0
         total_charge_mins = 0
         charge_slot_dict_list = []
         charge_mins_left = charge_mins
-        for index in range(0, len(sorted_costs)):
-            if index < len(sorted_dates):
-                slot_start_t = sorted_dates[index]
-                slot_end_t = slot_start_t+timedelta(minutes=slot_duration_mins)
-                # If we need the entire charge slot
-                if charge_mins_left >= slot_duration_mins:
-                    charge_slot_dict = {}
-                    charge_slot_dict[RegionalElectricity.SLOT_START_DATETIME] = slot_start_t
-                    charge_slot_dict[RegionalElectricity.SLOT_STOP_DATETIME] = slot_end_t
-                    charge_slot_dict[RegionalElectricity.SLOT_COST] = sorted_costs[index]
-                    charge_slot_dict_list.append(charge_slot_dict)
-                    charge_mins_left = charge_mins_left - slot_duration_mins
-                    total_charge_mins = total_charge_mins + slot_duration_mins
-                    cost = cost + (((slot_duration_mins/60.0)*charge_rate_kw)*charge_slot_dict[RegionalElectricity.SLOT_COST])
-
-                else:
-                    # If we need part of another slot to complete the charge.
-                    # The minimum time we will turn the charger on is 15 mins.
-                    # This governs the max charge error.
-                    if charge_mins_left >= 15:
-                        slot_end_t = slot_start_t+timedelta(minutes=charge_mins_left)
-                        charge_slot_dict = {}
-                        charge_slot_dict[RegionalElectricity.SLOT_START_DATETIME] = slot_start_t
-                        charge_slot_dict[RegionalElectricity.SLOT_STOP_DATETIME] = slot_end_t
-                        charge_slot_dict[RegionalElectricity.SLOT_COST] = sorted_costs[index]
-                        charge_slot_dict_list.append(charge_slot_dict)
-                        total_charge_mins = total_charge_mins + charge_mins_left
-                        slot_cost = charge_slot_dict[RegionalElectricity.SLOT_COST]
-                        cost = cost + (((charge_mins_left/60.0)*charge_rate_kw)*slot_cost)
-                        charge_mins_left = 0
-
-                    break
+        for slot_cost, slot_start_t in sorted_pairs:
+            # Stop as soon as the requested charge time is covered.
+            if charge_mins_left <= 0:
+                break
+            slot_end_t = slot_start_t+slot_delta
+            # If we need the entire charge slot
+            if charge_mins_left >= slot_duration_mins:
+                charge_slot_dict_list.append({start_key: slot_start_t,
+                                              stop_key: slot_end_t,
+                                              cost_key: slot_cost})
+                charge_mins_left = charge_mins_left - slot_duration_mins
+                total_charge_mins = total_charge_mins + slot_duration_mins
+                cost = cost + (kwh_per_slot*slot_cost)
+
+            else:
+                # If we need part of another slot to complete the charge.
+                # The minimum time we will turn the charger on is 15 mins.
+                # This governs the max charge error.
+                if charge_mins_left >= 15:
+                    slot_end_t = slot_start_t+timedelta(minutes=charge_mins_left)
+                    charge_slot_dict_list.append({start_key: slot_start_t,
+                                                  stop_key: slot_end_t,
+                                                  cost_key: slot_cost})
+                    total_charge_mins = total_charge_mins + charge_mins_left
+                    cost = cost + (((charge_mins_left/60.0)*charge_rate_kw)*slot_cost)
+                    charge_mins_left = 0
+
+                break
 
         return (charge_slot_dict_list,
                 end_charge_datetime,
@@ -2228,8 +2754,13 @@ class GUIServer(object):
             self._plot_container.clear()
 
             fig = go.Figure()
-            max_cost = max(plot_cost_list)
-            min_cost = min(plot_cost_list)
+            # Find the min and max cost in a single pass over the list.
+            min_cost = max_cost = plot_cost_list[0]
+            for plot_cost in plot_cost_list:
+                if plot_cost < min_cost:
+                    min_cost = plot_cost
+                elif plot_cost > max_cost:
+                    max_cost = plot_cost
             if min_cost > 0:
                 min_cost = 0
             fig.update_layout(margin=dict(l=0, r=0, t=0, b=0),
@@ -2257,20 +2788,22 @@ class GUIServer(object):
 
             self._plot_charge_times(fig, charge_slot_dict_list)
 
-            # Add the new plot to the container
+            # Compute the label values before entering the container so the context
+            # is held for the minimum time.
+            hours_charge_factor = total_charge_mins/60.0
+            charge_adjustment_factor = self._cmd_line_config_manager.getAttr(GUIServer.ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT)
+            kwh = charge_adjustment_factor * (hours_charge_factor*float(self._zappi_max_charge_rate.value))
+            self._target_ev_charge_kwh = kwh
+            battery_charged_percentage = self._target_ev_charge_input.value
+            # we may be charging slightly longer than is required (due to 15 min charge increments)
+            # so limit the max to 100%
+            if battery_charged_percentage > 100.0:
+                battery_charged_percentage = 100.0
+
+            # Add the new plot and labels to the container in one block so the
+            # client is only synced once.
             with self._plot_container:
                 ui.plotly(fig)
-
-            with self._plot_container:
-                hours_charge_factor = total_charge_mins/60.0
-                charge_adjustment_factor = self._cmd_line_config_manager.getAttr(GUIServer.ZAPPI_CHARGE_ADJUSTMENT_FACTOR_FLOAT)
-                kwh = charge_adjustment_factor * (hours_charge_factor*float(self._zappi_max_charge_rate.value))
-                self._target_ev_charge_kwh = kwh
-                battery_charged_percentage = self._target_ev_charge_input.value
-                # we may be charging slightly longer than is required (due to 15 min charge increments)
-                # so limit the max to 100%
-                if battery_charged_percentage > 100.0:
-                    battery_charged_percentage = 100.0
                 ui.label(f"Charge for {int(total_charge_mins)} minutes to reach {battery_charged_percentage:.0f}%")
                 ui.label(f"using {kwh:.1f} kWh of energy (cost = £{cost:.2f}).")
 
@@ -2286,12 +2819,19 @@ class GUIServer(object):
         """@brief Plot the charge times in red on the charge plot.
            @param fig plotly figure as returned from go.Figure()
            @param charge_slot_dict_list"""
+        # One Scatter trace with None separators between the slot segments is far
+        # cheaper than one trace (schema validation + trace list rebuild) per slot.
+        start_key = RegionalElectricity.SLOT_START_DATETIME
+        stop_key = RegionalElectricity.SLOT_STOP_DATETIME
+        cost_key = RegionalElectricity.SLOT_COST
+        x = []
+        y = []
         for charge_slot_dict in charge_slot_dict_list:
-            startT = charge_slot_dict[RegionalElectricity.SLOT_START_DATETIME]
-            stopT = charge_slot_dict[RegionalElectricity.SLOT_STOP_DATETIME]
-            x = [startT, stopT]
-            y = [charge_slot_dict[RegionalElectricity.SLOT_COST], charge_slot_dict[RegionalElectricity.SLOT_COST]]
-            fig.add_trace(go.Scatter(x=x, y=y, line=dict(width=5), marker=dict(size=10, color='red')))
+            slot_cost = charge_slot_dict[cost_key]
+            x.extend((charge_slot_dict[start_key], charge_slot_dict[stop_key], None))
+            y.extend((slot_cost, slot_cost, None))
+        if x:
+            fig.add_trace(go.Scatter(x=x, y=y, line=dict(width=5), marker=dict(size=10, color='red'), connectgaps=False))
 
     def _set_zappi_charge(self):
         """@brief Set a zappi charge schedule."""
@@ -2299,7 +2839,7 @@ class GUIServer(object):
             ui.notify("No charge schedule found.", type='negative')
         else:
             ui.notify("Setting zappi charge schedule", position='center')
-            threading.Thread(target=self._set_zappi_charge_thread).start()
+            self._run_in_background(self._set_zappi_charge_thread)
             self._reset_polling_rate()
 
     def _set_zappi_charge_thread(self):
@@ -2317,33 +2857,27 @@ class GUIServer(object):
             msg_dict[GUIServer.INFO_MESSAGE] = "Set the zappi to eco+ charge mode."
             self._update_gui(msg_dict)
 
-        sorted_charge_slot_dict_list = sorted(deepcopy(self._charge_slot_dict_list), key=lambda x: x[RegionalElectricity.SLOT_START_DATETIME])
+        # Shallow per dict copies are sufficient as the merge loop below only
+        # rebinds the SLOT_STOP_DATETIME entries and datetimes are immutable.
+        sorted_charge_slot_dict_list = sorted((slot_dict.copy() for slot_dict in self._charge_slot_dict_list),
+                                              key=itemgetter(RegionalElectricity.SLOT_START_DATETIME))
 
         # merge any consecutive slots together to reduce the number of zappi charge schedules which is limited to 4 on the my energi system.
-        index = 0
+        start_key = RegionalElectricity.SLOT_START_DATETIME
+        stop_key = RegionalElectricity.SLOT_STOP_DATETIME
         merged_charge_slot_dict_list = []
-        list_size = len(sorted_charge_slot_dict_list)
-        current_slot_start_dict = current_slot_end_dict = None
-        for index in range(0, list_size):
-            current_slot_dict = sorted_charge_slot_dict_list[index]
-            if current_slot_start_dict is None:
-                current_slot_start_dict = current_slot_end_dict = current_slot_dict
-            # If not on the last slot dict
-            if index < list_size-1:
-                next_slot_dict = sorted_charge_slot_dict_list[index+1]
-
-                # If the next slot starts when this slot ends
-                if current_slot_end_dict[RegionalElectricity.SLOT_STOP_DATETIME] == next_slot_dict[RegionalElectricity.SLOT_START_DATETIME]:
-                    current_slot_end_dict = next_slot_dict
-
-                else:
-                    current_slot_start_dict[RegionalElectricity.SLOT_STOP_DATETIME] = current_slot_end_dict[RegionalElectricity.SLOT_STOP_DATETIME]
-                    merged_charge_slot_dict_list.append(current_slot_start_dict)
-                    current_slot_start_dict = current_slot_end_dict = None
-
+        run_dict = None
+        for slot_dict in sorted_charge_slot_dict_list:
+            if run_dict is None:
+                run_dict = slot_dict
+            # If this slot starts when the current run ends extend the run.
+            elif run_dict[stop_key] == slot_dict[start_key]:
+                run_dict[stop_key] = slot_dict[stop_key]
             else:
-                current_slot_start_dict[RegionalElectricity.SLOT_STOP_DATETIME] = current_slot_end_dict[RegionalElectricity.SLOT_STOP_DATETIME]
-                merged_charge_slot_dict_list.append(current_slot_start_dict)
+                merged_charge_slot_dict_list.append(run_dict)
+                run_dict = slot_dict
+        if run_dict is not None:
+            merged_charge_slot_dict_list.append(run_dict)
 
         try:
             if len(merged_charge_slot_dict_list) == 0:
@@ -2362,7 +2896,21 @@ class GUIServer(object):
             # as I've seen the myenergi system take up to 5 minutes to delete a schedule after sending a
             # successfull command. We want to have it clear before the next 15 minute charge slot.
             clear_schedule_time = charge_end_time + timedelta(minutes=10)
-            self._cfg_mgr.addAttr(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, clear_schedule_time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            # Stored as integer epoch seconds (see _get_clear_zappi_schedule_time()).
+            self._set_cfg(GUIServer.CLEAR_ZAPPI_SCHEDULE_TIME, int(clear_schedule_time.timestamp()))
+
+            # Poll the zappi until the schedule just set is visible rather than
+            # leaving the user to guess when the myenergi system has caught up.
+            expected_start_times = set()
+            for slot_dict in merged_charge_slot_dict_list:
+                start_datetime = slot_dict[RegionalElectricity.SLOT_START_DATETIME]
+                expected_start_times.add(f"{start_datetime.hour:02d}:{start_datetime.minute:02d}")
+            # The poll can take up to two minutes so it gets its own thread. Running
+            # it here would hold the shared FIFO worker and stall every queued job
+            # (boosts, schedule clears, config saves) behind it.
+            threading.Thread(target=self._verify_zappi_charge_schedule,
+                             args=(expected_start_times,),
+                             daemon=True).start()
 
         except Exception as ex:
             GUIServer.Print_Exception()
@@ -2370,6 +2918,34 @@ class GUIServer(object):
             msg_dict[GUIServer.ERROR_MESSAGE] = str(ex)
             self._update_gui(msg_dict)
 
+    def _verify_zappi_charge_schedule(self, expected_start_times, timeout_seconds=120, poll_seconds=5):
+        """@brief Poll the zappi charge schedules until the schedule just set is
+                  reported back by the myenergi system or the timeout expires, and
+                  tell the user the outcome. The myenergi system can take minutes to
+                  apply a schedule so a fixed delay either reports too early or keeps
+                  the user waiting longer than needed.
+           @param expected_start_times A set of HH:MM slot start times that were set.
+           @param timeout_seconds Give up after this many seconds.
+           @param poll_seconds The delay between schedule reads."""
+        timeout_time = time() + timeout_seconds
+        while time() < timeout_time:
+            sleep(poll_seconds)
+            try:
+                table_row_list = self._my_energi.get_zappi_schedule_list()
+            except Exception:
+                # Transient read errors just mean we try again until the timeout.
+                continue
+            read_start_times = set(row[0] for row in table_row_list)
+            if expected_start_times.issubset(read_start_times):
+                msg_dict = {}
+                msg_dict[GUIServer.INFO_MESSAGE] = "The charge schedule is now set on your ZAPPI."
+                self._update_gui(msg_dict)
+                self._send_zappi_sched_to_gui(table_row_list)
+                return
+        msg_dict = {}
+        msg_dict[GUIServer.WARNING_MESSAGE] = "The ZAPPI has not yet reported the charge schedule. Select the Get button to check it later."
+        self._update_gui(msg_dict)
+
     def _clear_zappi_charge_schedules(self):
         """@brief Reset/disable all zappi charge schedules.
                   Called from the GUI thread when the user presses the clear schedules button.
@@ -2380,7 +2956,7 @@ class GUIServer(object):
         # Reset this so that the Set button returns to it's original color.
         self._zappi_charge_schedule_active = False
         self._clear_zappi_button.disable()
-        threading.Thread(target=self._clear_zappi_charge_schedules_thread).start()
+        self._run_in_background(self._clear_zappi_charge_schedules_thread)
 
     def _clear_zappi_charge_schedules_thread(self, send_charged_msg=False):
         """@brief Reset/disable all zappi charge schedules. This must be called outside the GUI thread.